@@ -5,32 +5,60 @@ Galois Playground Backend
 This is the main backend using direct SageMath import for maximum speed
 """
 
+import asyncio
+import functools
+import itertools
+import json
+import logging
+import math
+import sys
 import time
-from typing import Dict, Any, Optional
-from chm_label_to_tex import extract_group_notation
+from urllib.parse import urlencode
+from typing import Dict, Any, Iterable, List, Optional
+from chm_label_to_tex import extract_group_notation, transitive_group_notation
+from jobs import JobManager, JOB_COMPLETED, JOB_FAILED
+from worker_pool import WorkerPool, BudgetExceeded, budget_failure
+from budgets import Budget, error_message, record_partial
+from result_cache import ResultCache
+from metrics import MetricsRegistry, StageTimer
+from polynomial_parser import PolynomialParseError, canonical_form, parse_coefficients, format_polynomial, monic
+from computation_context import get_context
+from field_index import default_index
+from group_metadata import DEFAULT_DEGREES as DEFAULT_METADATA_DEGREES, group_properties, precompute_metadata
+from sage_runtime import import_sage, sage_import_seconds
+from roots import DEFAULT_DIGITS as DEFAULT_ROOT_DIGITS, MAX_DIGITS as MAX_ROOT_DIGITS
+from http_cache import IMMUTABLE, NO_STORE, cache_headers, encode, matching_etag, representation, strong_etag
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse, Response, StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 
-# Set environment variables before importing SageMath
+# Set environment variables before any process imports SageMath
 import os
 os.environ['SAGE_NUM_THREADS'] = '1'
 os.environ['OMP_NUM_THREADS'] = '1'
 os.environ['PARI_SIZE'] = '2000000000'
 
-# Import SageMath directly - this eliminates startup overhead completely
-from sage.all import * # type: ignore
+# SageMath is imported lazily (see sage_runtime.py): the API process does not need it,
+# and worker processes import it once at startup
+logger = logging.getLogger("galois")
 
 
 # Request/Response models
 class PolynomialRequest(BaseModel):
     polynomial: str
     compute_splitting_field: Optional[bool] = False
+    normalize_field: Optional[bool] = None
+    mode: Optional[str] = "exact"
+    include_timings: Optional[bool] = False
+    root_digits: Optional[int] = DEFAULT_ROOT_DIGITS
 
 class SplittingFieldRequest(BaseModel):
     polynomial: str
+    include_timings: Optional[bool] = False
 
 class ComputationResponse(BaseModel):
     polynomial: str
@@ -42,226 +70,480 @@ class ComputationResponse(BaseModel):
     is_irreducible: Any = None
     computation_successful: bool
     error: Optional[str] = None
+    error_type: Optional[str] = None
+    computation_time_seconds: Optional[float] = None
+    queue_wait_seconds: Optional[float] = None
+    cache_hit: Optional[bool] = None
+    reduced_polynomial: Optional[str] = None
+    field_cache_hit: Optional[bool] = None
+    timings: Optional[Dict[str, Any]] = None
+    budget: Optional[Dict[str, Any]] = None
+    partial_results: Optional[Dict[str, Any]] = None
+    factors: Optional[List[Dict[str, Any]]] = None
+    engine: Optional[Dict[str, Any]] = None
 
 class SplittingFieldResponse(BaseModel):
     polynomial: str
     splitting_field: Optional[Dict[str, Any]] = None
     computation_successful: bool
     error: Optional[str] = None
+    error_type: Optional[str] = None
+    computation_time_seconds: Optional[float] = None
+    queue_wait_seconds: Optional[float] = None
+    cache_hit: Optional[bool] = None
+    timings: Optional[Dict[str, Any]] = None
+    budget: Optional[Dict[str, Any]] = None
+    partial_results: Optional[Dict[str, Any]] = None
+    factors: Optional[List[Dict[str, Any]]] = None
+    job_id: Optional[str] = None
+
+class BatchRequest(BaseModel):
+    polynomials: List[str]
+
+class JobRequest(BaseModel):
+    polynomial: str
+    kind: Optional[str] = "splitting_field"
+
+
+@functools.lru_cache(maxsize=None)
+def polynomial_ring():
+    """The shared ring Q[x] and its generator, built once per process."""
+    import_sage()
+    from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing  # type: ignore
+    from sage.rings.rational_field import QQ  # type: ignore
+    R = PolynomialRing(QQ, 'x')
+    return R, R.gen()
+
+
+# Galois groups and splitting fields of irreducible polynomials are computed directly up to this
+# degree. Reducible polynomials of any parseable degree are handled factor by factor.
+MAX_SUPPORTED_DEGREE = 11
+
+# Irreducible polynomials of degree MAX_SUPPORTED_DEGREE + 1 up to this go through the tiered
+# engine (see high_degree_group); anything above is rejected
+MAX_HIGH_DEGREE = 15
+
+# Products whose factor group orders multiply to more than this get a bounded, unproven group order
+# instead of a compositum, which would not fit in a request's budget
+MAX_COMPOSITUM_DEGREE = int(os.environ.get('GALOIS_MAX_COMPOSITUM_DEGREE', 1000))
+
+
+def polynomial_from_coefficients(coefficients):
+    """Build an element of the shared ring Q[x] from rational coefficients, constant term first."""
+    R, _ = polynomial_ring()
+    QQ = R.base_ring()
+    return R([QQ((c.numerator, c.denominator)) for c in coefficients])
+
+
+def parse_polynomial(polynomial_str):
+    """Parse a polynomial in x into the shared ring Q[x]."""
+    return polynomial_from_coefficients(parse_coefficients(polynomial_str))
+
+
+def polynomial_context(coefficients):
+    """
+    The shared computation context for the polynomial, keyed by its canonical form and built from it,
+    so what the context reports does not depend on which spelling of the polynomial came first.
+    """
+    canonical = monic(coefficients)
+    return get_context(format_polynomial(canonical), polynomial_from_coefficients(canonical))
+
+
+def describe_splitting_field(splitting_field, poly):
+    try:
+        defining_poly = str(splitting_field.defining_polynomial())
+    except Exception:
+        defining_poly = None
+    
+    return {
+        "field": str(splitting_field),
+        "degree": int(splitting_field.degree()),
+        "defining_polynomial": defining_poly,
+        "description": f"The splitting field of {poly} over ℚ",
+        "computed": True
+    }
+
+
+def indexed_group(keys, poly):
+    """Galois group info from the offline field index (GALOIS_FIELD_INDEX) for the first key found, or None."""
+    index = default_index()
+    if index is None:
+        return None
+    for key in keys:
+        entry = index.lookup(key)
+        if entry is not None:
+            label, order = entry["transitive_label"], entry["order"]
+            return {
+                "order": order,
+                "description": f"Galois group {label} with order {order} of {poly}",
+                "structure": label,
+                "transitive_label": label,
+                "explicit": transitive_group_notation(entry["degree"], entry["t_number"], order),
+                "proven": True,
+                "method": "index"
+            }
+    return None
+
+
+def transitive_group_properties(transitive_label):
+    """Solvability and other properties of the group "dTn" from the metadata table, or None if unavailable."""
+    if not transitive_label or "T" not in transitive_label:
+        return None
+    degree, t_number = transitive_label.split("T")
+    try:
+        return group_properties(int(degree), int(t_number))
+    except Exception:
+        return None
+
+
+def parse_error_result(polynomial_str, error):
+    return {
+        "polynomial": polynomial_str,
+        "error": str(error),
+        "error_type": error.error_type,
+        "computation_successful": False
+    }
+
+
+def constant_polynomial_result(coefficients):
+    """Error for constant inputs, decided from the coefficients alone (None for degree 1 and up)."""
+    degree = len(coefficients) - 1
+    if degree >= 1:
+        return None
+    return {
+        "polynomial": format_polynomial(coefficients),
+        "degree": max(degree, 0),
+        "error": "Constant polynomials have no roots. Please enter a polynomial of degree at least 1.",
+        "error_type": "degree_too_low",
+        "computation_successful": False
+    }
+
+
+def degree_too_high_result(poly, message):
+    """Error for irreducible polynomials above MAX_HIGH_DEGREE."""
+    return {
+        "polynomial": str(poly),
+        "degree": int(poly.degree()),
+        "is_irreducible": True,
+        "error": message,
+        "error_type": "degree_too_high",
+        "computation_successful": False
+    }
+
+
+def reducible_result(poly, message):
+    """
+    Error for reducible polynomials, carrying the factorization so that the API can
+    compute the factors separately and compose their results (see compose_reducible).
+    Factors are monic, so each prints in the canonical form used for cache keys.
+    """
+    factorization = poly.factor()
+    return {
+        "polynomial": str(factorization),
+        "degree": int(poly.degree()),
+        "is_irreducible": False,
+        "factors": [{"polynomial": str(f), "degree": int(f.degree()), "multiplicity": int(e)} for f, e in factorization],
+        "error": message,
+        "error_type": "reducible_polynomial",
+        "computation_successful": False
+    }
 
 
 def compute_splitting_field(polynomial_str):
     """Compute splitting field information for the given polynomial."""
+    timer = StageTimer()
     try:
-        R = PolynomialRing(QQ, 'x')
-        x = R.gen()
+        try:
+            coefficients = parse_coefficients(polynomial_str)
+        except PolynomialParseError as e:
+            return parse_error_result(polynomial_str, e)
         
-        poly = sage_eval(polynomial_str, locals={'x': x})
+        unsupported = constant_polynomial_result(coefficients)
+        if unsupported is not None:
+            return dict(unsupported, splitting_field=None)
+        
+        poly = polynomial_from_coefficients(coefficients)
+        context = polynomial_context(coefficients)
+        reused = context.computed()
+        timer.lap("parse")
 
-        if not poly.is_irreducible():
-            return {
-                "polynomial": str(poly.factor()),
-                "splitting_field": None,
-                "error": "This polynomial is reducible over Q. Consider its irreducible factors instead.",
-                "error_type": "reducible_polynomial",
-                "computation_successful": False
-            }
+        if not context.is_irreducible():
+            return dict(reducible_result(poly, "This polynomial is reducible over Q. Its splitting field is the compositum of its factors' splitting fields."),
+                        splitting_field=None)
         
-        if poly.degree() >= 12:
-            return {
-                "polynomial": str(poly.factor()),
-                "splitting_field": None,
-                "error": "Polynomials of degree 12 or higher are not supported for splitting field computation.",
-                "error_type": "degree_too_high",
-                "computation_successful": False
-            }
+        timer.lap("is_irreducible")
+        if poly.degree() > MAX_HIGH_DEGREE:
+            return dict(degree_too_high_result(poly, "Irreducible polynomials of degree 16 or higher are not supported for splitting field computation."),
+                        splitting_field=None)
+        record_partial(polynomial=str(poly), is_irreducible=True, degree=int(poly.degree()))
         
         try:
-            splitting_field = poly.splitting_field('b')
+            # Reuses the Galois closure if a Galois group request for this polynomial came first
+            splitting_field = context.splitting_field()
+            timer.lap("splitting_field")
             
-            field_str = str(splitting_field)
-            field_degree = int(splitting_field.degree())
-            
-            try:
-                if hasattr(splitting_field, 'defining_polynomial'):
-                    defining_poly = str(splitting_field.defining_polynomial())
-                else:
-                    defining_poly = None
-            except:
-                defining_poly = None
-            
-            splitting_field_info = {
-                "field": field_str,
-                "degree": field_degree,
-                "defining_polynomial": defining_poly,
-                "description": f"The splitting field of {poly} over ℚ",
-                "computed": True
-            }
+            splitting_field_info = describe_splitting_field(splitting_field, poly)
+            timer.lap("format")
             
             return {
                 "polynomial": str(poly.factor()),
                 "splitting_field": splitting_field_info,
-                "computation_successful": True
+                "computation_successful": True,
+                "timings": dict(timer.to_dict(), reused=reused)
             }
             
         except Exception as e:
             return {
                 "polynomial": str(poly.factor()),
                 "splitting_field": None,
-                "error": f"Failed to compute splitting field: {str(e)}",
+                "error": f"Failed to compute splitting field: {error_message(e)}",
                 "computation_successful": False
             }
         
     except Exception as e:
         return {
             "polynomial": str(poly) if 'poly' in locals() else polynomial_str,
-            "error": str(e),
+            "error": error_message(e),
             "computation_successful": False
         }
 
 
-def compute_galois_info(polynomial_str, compute_splitting_field=False):
-    """Compute Galois group information for the given polynomial."""
+def reduce_defining_polynomial(polynomial_str):
+    """
+    Return the polredabs representative of the number field defined by the polynomial.
+    Polynomials defining the same field (e.g. x^2 - 8 and x^2 - 2) share a representative.
+    Returns None when the input is not a supported irreducible polynomial.
+    """
+    R, _ = polynomial_ring()
+    coefficients = parse_coefficients(polynomial_str)
+    if not 1 <= len(coefficients) - 1 <= MAX_SUPPORTED_DEGREE:
+        return None
+    context = polynomial_context(coefficients)
+    if not context.is_irreducible():
+        return None
+    poly = context.poly
+    
+    from sage.libs.pari import pari  # type: ignore
+    
+    # polredabs wants integral coefficients
+    integral = poly * poly.denominator()
+    return str(R(pari(integral).polredabs()))
+
+
+def high_degree_group(poly, mode="exact", timer=None):
+    """
+    Galois group info for an irreducible polynomial of degree 12-15 from certificates, cheapest first:
+    the discriminant and Frobenius cycle types (tier "prescreen"), then the factorization of the
+    2-set resolvent (tier "resolvent"). Returns (group info or None, engine report). The report names
+    the tier that produced the answer; if neither tier proves the group, the most likely candidate is
+    returned unproven and, in exact mode, the report asks for the full computation, which the API runs
+    as a budgeted background job. Each tier is a lap of `timer`, so its cost stays out of the group info.
+    """
+    from prescreen import sample_invariants, screen_sample
+    from resolvents import two_set_orbits
+    
+    timer = timer or StageTimer()
+    n = int(poly.degree())
+    tier = "prescreen"
+    discriminant_is_square, counts = sample_invariants(poly)
+    screen = screen_sample(n, discriminant_is_square, counts)
+    timer.lap("prescreen")
+    
+    if not screen["proven"]:
+        tier = "resolvent"
+        orbits = two_set_orbits(poly)
+        if orbits is not None:
+            screen = screen_sample(n, discriminant_is_square, counts, orbits)
+        timer.lap("resolvent")
+    
+    engine = {
+        "tier": tier,
+        "proven": screen["proven"],
+        "pending_full_computation": not screen["proven"] and mode == "exact"
+    }
+    if not screen.get("candidates"):
+        return None, engine
+    
+    qualifier = "" if screen["proven"] else " (probabilistic)"
+    return {
+        "order": screen["order"],
+        "description": f"Galois group {screen['transitive_label']} with order {screen['order']} of {poly}{qualifier}",
+        "structure": screen["transitive_label"],
+        "transitive_label": screen["transitive_label"],
+        "explicit": screen["explicit"],
+        "proven": screen["proven"],
+        "confidence": screen["confidence"],
+        "method": screen["method"],
+        "prescreen": screen,
+        "engine": engine
+    }, engine
+
+
+def compute_galois_info(polynomial_str, compute_splitting_field=False, reduced_polynomial_str=None, known_group=None, mode="exact",
+                        root_digits=DEFAULT_ROOT_DIGITS, until=None, full_high_degree=False):
+    """
+    Compute Galois group information for the given polynomial.
+    If `reduced_polynomial_str` is given, the group is computed on that (equivalent, polredabs)
+    polynomial instead; `known_group` skips the group computation entirely.
+    Otherwise the offline field index is consulted before any group computation.
+    In "fast" mode a discriminant/Frobenius pre-screen is tried first, and its answer is used
+    when it is proven or at least GALOIS_PRESCREEN_CONFIDENCE likely.
+    Roots are printed with `root_digits` correct decimals.
+    `until` ("irreducibility" or "group") stops after that stage with a partial result. The
+    computation context keeps the work, so a later call for the same polynomial carries on from there.
+    Irreducible polynomials of degree 12-15 are identified by the tiered engine (high_degree_group)
+    unless `full_high_degree` asks for the full computation; the group's `engine` reports the tier.
+    """
+    timer = StageTimer()
     try:
-        R = PolynomialRing(QQ, 'x')
-        x = R.gen()
+        try:
+            coefficients = parse_coefficients(polynomial_str)
+        except PolynomialParseError as e:
+            return parse_error_result(polynomial_str, e)
         
-        poly = sage_eval(polynomial_str, locals={'x': x})
-
-        if not poly.is_irreducible():
-            return {
-                "polynomial": str(poly.factor()),
-                "degree": int(poly.degree()),
-                "is_irreducible": False,
-                "error": "This polynomial is reducible over Q and does not have a single Galois group. Consider its irreducible factors instead.",
-                "error_type": "reducible_polynomial",
-                "computation_successful": False
-            }
+        unsupported = constant_polynomial_result(coefficients)
+        if unsupported is not None:
+            return unsupported
+        
+        poly = polynomial_from_coefficients(coefficients)
+        context = polynomial_context(coefficients)
+        reused = context.computed()
+        timer.lap("parse")
         
-        if poly.degree() >= 12:
+        if known_group is None:
+            index_keys = [format_polynomial(monic(coefficients))]
+            if reduced_polynomial_str is not None:
+                index_keys.append(reduced_polynomial_str)
+            known_group = indexed_group(index_keys, poly)
+            timer.lap("field_index")
+
+        # A known group (indexed or from the field cache) implies the polynomial is irreducible
+        if known_group is None and not context.is_irreducible():
+            return reducible_result(poly, "This polynomial is reducible over Q. Its Galois group is composed from the groups of its irreducible factors.")
+
+        timer.lap("is_irreducible")
+        if known_group is None and poly.degree() > MAX_HIGH_DEGREE:
+            return degree_too_high_result(
+                poly,
+                "Irreducible polynomials of degree 16 or higher are not supported. Galois group computations for high-degree polynomials can be extremely time-intensive. Please try a polynomial of degree 15 or lower.")
+        record_partial(polynomial=str(poly), is_irreducible=True, polynomial_degree=int(poly.degree()))
+        if until == "irreducibility":
             return {
-                "polynomial": str(poly.factor()),
+                "polynomial": str(poly),
                 "degree": int(poly.degree()),
                 "is_irreducible": True,
-                "error": "Polynomials of degree 12 or higher are not supported. Galois group computations for high-degree polynomials can be extremely time-intensive. Please try a polynomial of degree 11 or lower.",
-                "error_type": "degree_too_high",
-                "computation_successful": False
+                "computation_successful": True,
+                "timings": dict(timer.to_dict(), reused=reused)
             }
 
-        K = NumberField(poly, names=('a',))
-        group = K.galois_group()
-        order = int(group.order())
-        group_name = str(group)
-        explicit_group = extract_group_notation(group, poly)
+        K = context.number_field()
+        timer.lap("number_field")
         
-        degree = order
-            
-        complex_roots = poly.complex_roots()
+        group_key = (mode, reduced_polynomial_str)
+        if known_group is None:
+            known_group = context.group_info.get(group_key)
+            if full_high_degree and known_group is not None and not known_group.get("proven", True):
+                known_group = None
         
-        roots = []
-        processed_indices = set()
+        high_degree = poly.degree() > MAX_SUPPORTED_DEGREE
+        if high_degree and known_group is None and not full_high_degree:
+            known_group, engine = high_degree_group(poly, mode, timer)
+            if known_group is None:
+                next_step = ("The full computation runs as a background job." if mode == "exact"
+                             else "Use exact mode to run the full computation.")
+                return {
+                    "polynomial": str(poly),
+                    "degree": int(poly.degree()),
+                    "is_irreducible": True,
+                    "engine": engine,
+                    "error": f"No transitive group is consistent with the sampled invariants. {next_step}",
+                    "error_type": "high_degree_pending",
+                    "computation_successful": False
+                }
         
-        for i, root in enumerate(complex_roots):
-            if i in processed_indices:
-                continue
-                
-            try:
-                complex_val = complex(root)
-                
-                if abs(complex_val.imag) < 1e-10:
-                    real_val = complex_val.real
-                    negative_index = None
-                    for j, other_root in enumerate(complex_roots):
-                        if j != i and j not in processed_indices:
-                            other_complex = complex(other_root)
-                            if (abs(other_complex.imag) < 1e-10 and 
-                                abs(other_complex.real + real_val) < 1e-6):
-                                negative_index = j
-                                break
-                    
-                    if negative_index is not None:
-                        abs_val = abs(real_val)
-                        roots.append(f"\\pm {abs_val:.6f}")
-                        processed_indices.add(negative_index)
-                    else:
-                        roots.append(f"{real_val:.6f}")
-                        
-                else:
-                    conjugate_index = None
-                    for j, other_root in enumerate(complex_roots):
-                        if j != i and j not in processed_indices:
-                            other_complex = complex(other_root)
-                            if (abs(other_complex.real - complex_val.real) < 1e-6 and 
-                                abs(other_complex.imag + complex_val.imag) < 1e-6):
-                                conjugate_index = j
-                                break
-                    
-                    if conjugate_index is not None:
-                        real_part = complex_val.real
-                        imag_part = abs(complex_val.imag)
-                        
-                        if abs(real_part) < 1e-10:
-                            roots.append(f"\\pm {imag_part:.6f}i")
-                        else:
-                            roots.append(f"{real_part:.6f} \\pm {imag_part:.6f}i")
-                        processed_indices.add(conjugate_index)
-                    else:
-                        if abs(complex_val.real) < 1e-10:
-                            roots.append(f"{complex_val.imag:.6f}i")
-                        else:
-                            roots.append(f"{complex_val.real:.6f} + {complex_val.imag:.6f}i")
-                        
-            except Exception as e:
-                roots.append(str(root))
-            
-            processed_indices.add(i)
+        if mode == "fast" and known_group is None and not high_degree:
+            from prescreen import prescreen_galois_group, DEFAULT_CONFIDENCE as PRESCREEN_CONFIDENCE
+            screen = prescreen_galois_group(poly)
+            timer.lap("prescreen")
+            if screen["proven"] or screen["confidence"] >= PRESCREEN_CONFIDENCE:
+                qualifier = "" if screen["proven"] else " (probabilistic)"
+                known_group = {
+                    "order": screen["order"],
+                    "description": f"Galois group {screen['transitive_label']} with order {screen['order']} of {poly}{qualifier}",
+                    "structure": screen["transitive_label"],
+                    "transitive_label": screen["transitive_label"],
+                    "explicit": screen["explicit"],
+                    "proven": screen["proven"],
+                    "confidence": screen["confidence"],
+                    "method": "prescreen",
+                    "prescreen": screen
+                }
         
-        try:
-            is_irreducible = bool(poly.is_irreducible())
-        except:
-            is_irreducible = "Unknown"
+        if known_group is not None:
+            galois_group_info = dict(known_group)
+        else:
+            group_context = context
+            if reduced_polynomial_str is not None:
+                group_context = polynomial_context(parse_coefficients(reduced_polynomial_str))
+            group = group_context.galois_group()
+            group_name = str(group)
+            galois_group_info = {
+                "order": int(group.order()),
+                "description": group_name,
+                "structure": group_name,
+                "transitive_label": f"{poly.degree()}T{group.transitive_number()}",
+                "explicit": extract_group_notation(group, poly),
+                "proven": True,
+                "method": "full"
+            }
+            timer.lap("galois_group")
+            if high_degree:
+                galois_group_info["engine"] = {"tier": "full", "proven": True, "pending_full_computation": False}
+        
+        if "properties" not in galois_group_info:
+            galois_group_info["properties"] = transitive_group_properties(galois_group_info["transitive_label"])
+            timer.lap("group_properties")
+        
+        context.group_info[group_key] = galois_group_info
+        degree = galois_group_info["order"]
+        record_partial(degree=degree, galois_group=galois_group_info, number_field=str(K))
+        timer.skip()
+        if until == "group":
+            return {
+                "polynomial": str(poly),
+                "degree": degree,
+                "galois_group": galois_group_info,
+                "number_field": str(K),
+                "is_irreducible": True,
+                "computation_successful": True,
+                "timings": dict(timer.to_dict(), reused=reused)
+            }
+            
+        roots = context.roots(root_digits)
+        timer.lap("roots")
+        record_partial(roots=roots)
         
         # Initialize result without splitting field info
         result = {
             "polynomial": str(poly.factor()),
             "degree": degree,
-            "galois_group": {
-                "order": order,
-                "description": group_name,
-                "structure": group_name,
-                "explicit": explicit_group
-            },
+            "galois_group": galois_group_info,
             "roots": roots,
             "number_field": str(K),
-            "is_irreducible": is_irreducible,
+            "is_irreducible": True,
             "computation_successful": True
         }
         
+        if reduced_polynomial_str is not None:
+            result["reduced_polynomial"] = reduced_polynomial_str
+        
         # Only compute splitting field if requested
         if compute_splitting_field:
             try:
-                splitting_field = poly.splitting_field('b')
+                splitting_field = context.splitting_field()
+                timer.lap("splitting_field")
                 
-                field_str = str(splitting_field)
-                field_degree = int(splitting_field.degree())
-                
-                try:
-                    if hasattr(splitting_field, 'defining_polynomial'):
-                        defining_poly = str(splitting_field.defining_polynomial())
-                    else:
-                        defining_poly = None
-                except:
-                    defining_poly = None
-                
-                splitting_field_info = {
-                    "field": field_str,
-                    "degree": field_degree,
-                    "defining_polynomial": defining_poly,
-                    "description": f"The splitting field of {poly} over ℚ",
-                    "computed": True
-                }
-                
-                result["splitting_field"] = splitting_field_info
+                result["splitting_field"] = describe_splitting_field(splitting_field, poly)
                 
             except Exception as e:
                 # Fallback: provide some basic information even if splitting field computation fails
@@ -276,12 +558,98 @@ def compute_galois_info(polynomial_str, compute_splitting_field=False):
                 
                 result["splitting_field"] = splitting_field_info
         
+        timer.lap("format")
+        result["timings"] = dict(timer.to_dict(), reused=reused)
         return result
         
     except Exception as e:
         return {
             "polynomial": str(poly) if 'poly' in locals() else polynomial_str,
-            "error": str(e),
+            "error": error_message(e),
+            "computation_successful": False
+        }
+
+
+def shared_quadratic_subfields(factor_polynomials):
+    """
+    Number of factors whose quadratic subfield Q(sqrt(disc)) is already the quadratic subfield of
+    another factor's splitting field. Each one halves the compositum degree relative to the direct
+    product. Only needs discriminants: two fields agree when the product of their discriminants is a square.
+    """
+    classes, shared = [], 0
+    for key in factor_polynomials:
+        disc = polynomial_context(parse_coefficients(key)).poly.discriminant()
+        if disc.is_square():
+            continue
+        if any((disc * other).is_square() for other in classes):
+            shared += 1
+        else:
+            classes.append(disc)
+    return shared
+
+
+def compose_galois_groups(polynomial_str, factor_polynomials, factor_orders, compute_splitting_field=False):
+    """
+    Order of the Galois group of a product of irreducible factors, given each factor's canonical
+    form and group order. The product's splitting field is the compositum of the factors'
+    splitting fields, and its group embeds in the direct product of the factor groups with
+    equality exactly when the compositum degree is the product of the orders.
+    When the orders are pairwise coprime the splitting fields are linearly disjoint, so the
+    compositum is only built if the splitting field itself was asked for. A compositum of degree
+    above GALOIS_MAX_COMPOSITUM_DEGREE is not built either: the order is then only bounded,
+    using the quadratic subfields the factors share (`order_bound`).
+    """
+    timer = StageTimer()
+    try:
+        factors = sorted((order, key) for key, order in zip(factor_polynomials, factor_orders) if order > 1)
+        product = 1
+        for order, _ in factors:
+            product *= order
+        
+        disjoint = all(math.gcd(a, b) == 1 for (a, _), (b, _) in itertools.combinations(factors, 2))
+        result = {
+            "polynomial": polynomial_str,
+            "order": product,
+            "direct_product": True,
+            "computation_successful": True
+        }
+        if disjoint and not compute_splitting_field:
+            result["timings"] = timer.to_dict()
+            return result
+        if product > MAX_COMPOSITUM_DEGREE and not compute_splitting_field:
+            shared = shared_quadratic_subfields([key for _, key in factors])
+            timer.lap("discriminants")
+            result.update(order=product >> shared, direct_product=False if shared else None, order_bound=True)
+            result["timings"] = timer.to_dict()
+            return result
+        
+        # Largest first: the composite is mostly the biggest closure, which this worker may already hold
+        compositum = None
+        for order, key in reversed(factors):
+            splitting_field = polynomial_context(parse_coefficients(key)).splitting_field()
+            timer.lap("splitting_field")
+            if compositum is None:
+                compositum = splitting_field
+            else:
+                # Both fields are Galois, so all their composita are isomorphic
+                compositum = compositum.composite_fields(splitting_field)[0]
+                timer.lap("compositum")
+        
+        if compositum is None:
+            R, _ = polynomial_ring()
+            compositum = R.base_ring()
+        order = int(compositum.degree())
+        result.update(order=order, direct_product=order == product)
+        if compute_splitting_field:
+            result["splitting_field"] = describe_splitting_field(compositum, polynomial_str)
+        timer.lap("format")
+        result["timings"] = timer.to_dict()
+        return result
+        
+    except Exception as e:
+        return {
+            "polynomial": polynomial_str,
+            "error": error_message(e),
             "computation_successful": False
         }
 
@@ -293,6 +661,431 @@ app = FastAPI(
     version="4.0.0"
 )
 
+def compute_full_galois_info(polynomial_str):
+    """Job body for the full Galois group computation the tiered engine could not avoid (degrees 12-15)."""
+    return compute_galois_info(polynomial_str, full_high_degree=True)
+
+
+JOB_FUNCTIONS = {
+    "splitting_field": compute_splitting_field,
+    "galois": compute_full_galois_info,
+}
+
+# Budget kind of each job kind, where it differs (see budgets.py)
+JOB_BUDGETS = {
+    "galois": "high_degree",
+}
+
+# Created on startup so that spawned worker processes importing this module do not start pools of their own
+worker_pool: Optional[WorkerPool] = None
+job_manager: Optional[JobManager] = None
+result_cache = ResultCache.from_env()
+metrics = MetricsRegistry()
+
+# Reduce inputs to a polredabs representative before computing groups, unless the request says otherwise
+NORMALIZE_FIELDS_DEFAULT = os.environ.get('GALOIS_POLREDABS', '0') == '1'
+
+# Run on every worker before it takes traffic; override with GALOIS_WARMUP_CORPUS (one polynomial per line)
+# or GALOIS_WARMUP_POLYNOMIALS (separated by ';', empty to skip the warm-up)
+DEFAULT_WARMUP_POLYNOMIALS = ["x^2 - 2", "x^3 - 2", "x^4 - 10*x^2 + 1", "x^5 - x - 1", "x^6 + 3*x^3 - 1"]
+
+# Degrees whose candidate tables (cycle types, 2-set orbits) every worker builds during the warm-up;
+# override with GALOIS_WARMUP_TABLE_DEGREES (separated by ',', empty to skip)
+DEFAULT_WARMUP_TABLE_DEGREES = [12, 13, 14, 15]
+
+
+def warm_up_corpus():
+    """The warm-up polynomials from the environment, or the default corpus."""
+    path = os.environ.get('GALOIS_WARMUP_CORPUS')
+    if path:
+        with open(path) as f:
+            return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    polynomials = os.environ.get('GALOIS_WARMUP_POLYNOMIALS')
+    if polynomials is not None:
+        return [p.strip() for p in polynomials.split(';') if p.strip()]
+    return list(DEFAULT_WARMUP_POLYNOMIALS)
+
+
+def warm_up_table_degrees():
+    """The degrees whose candidate tables the warm-up builds, from the environment or the default."""
+    degrees = os.environ.get('GALOIS_WARMUP_TABLE_DEGREES')
+    if degrees is not None:
+        return [int(d) for d in degrees.split(',') if d.strip()]
+    return list(DEFAULT_WARMUP_TABLE_DEGREES)
+
+
+def warm_up_worker(polynomials, table_degrees=()):
+    """
+    First task of every worker: fill the group metadata table for degrees 1-11 and
+    `table_degrees` (the first worker of a deployment computes it, the others read it),
+    run the corpus through compute_galois_info to prime PARI, GAP and the computation
+    contexts, then load the tiered engine's candidate tables for `table_degrees` (persisted
+    in the metadata table) into memory for the life of the worker.
+    """
+    start = time.perf_counter()
+    metadata = precompute_metadata(sorted(set(DEFAULT_METADATA_DEGREES) | set(table_degrees)))
+    failures = [p for p in polynomials if not compute_galois_info(p).get("computation_successful")]
+    if failures:
+        logger.warning("Warm-up polynomials failed: %s", "; ".join(failures))
+    tables = 0
+    if table_degrees:
+        from prescreen import precompute_tables
+        tables = precompute_tables(table_degrees)
+    return {
+        "pid": os.getpid(),
+        "sage_import_seconds": sage_import_seconds(),
+        "warm_up_seconds": round(time.perf_counter() - start, 3),
+        "polynomials": len(polynomials),
+        "group_metadata": metadata,
+        "candidate_tables": tables,
+        "failures": failures,
+    }
+
+
+def run_in_pool(fn, *args, budget=None, affinity=None):
+    """Blocking helper for job threads: run `fn` on a worker process and wait for it."""
+    future = worker_pool.submit(fn, *args, budget=budget, affinity=affinity)
+    try:
+        result = dict(future.result())
+    except BudgetExceeded as e:
+        return budget_failure(e, args[0])
+    result["queue_wait_seconds"] = future.queue_wait_seconds
+    if result.get("computation_successful"):
+        result["computation_time_seconds"] = future.run_seconds
+    return result
+
+
+def galois_result_key(key, root_digits=DEFAULT_ROOT_DIGITS, normalize=False, mode="exact"):
+    """
+    Cache key of a Galois result. Roots, field normalization (which adds `reduced_polynomial`)
+    and the mode (which decides the method reported) are part of it, so a cached body is exactly
+    what a fresh computation with the same options would return.
+    """
+    if root_digits != DEFAULT_ROOT_DIGITS:
+        key = f"{key}|digits={root_digits}"
+    if normalize:
+        key = f"{key}|polredabs"
+    return key if mode == "exact" else f"{key}|mode={mode}"
+
+
+def product_group_properties(factor_groups):
+    """Properties of a subgroup of the direct product of the factor groups that projects onto each of them."""
+    properties = [g.get("properties") for g in factor_groups]
+    if not all(properties):
+        return None
+    # Solvable, abelian and nilpotent groups are closed under subgroups and quotients
+    combined = {flag: all(p[flag] for p in properties) for flag in ("solvable", "abelian", "nilpotent")}
+    return dict(combined, name=None, solvable_by_radicals=combined["solvable"], primitive=None)
+
+
+def product_galois_group(polynomial, factor_groups, composed):
+    """
+    Galois group info of a product from its nontrivial factors' groups and the compositum degree.
+    If the compositum was not built, `order` is an upper bound and the group is not proven.
+    """
+    order, direct = composed["order"], composed["direct_product"]
+    bound = composed.get("order_bound", False)
+    labels = [g["transitive_label"] for g in factor_groups]
+    notations = [g["explicit"].split(r" \cong ")[0] for g in factor_groups]
+    if not factor_groups:
+        structure, explicit = "trivial", transitive_group_notation(1, 1, 1)
+    elif len(factor_groups) == 1:
+        structure, explicit = labels[0], factor_groups[0]["explicit"]
+    elif direct:
+        structure, explicit = " x ".join(labels), r" \times ".join(notations)
+    elif bound:
+        structure = f"subgroup of order at most {order} of {' x '.join(labels)}"
+        explicit = r"G \leq " + r" \times ".join(notations)
+    else:
+        structure = f"subgroup of order {order} of {' x '.join(labels)}"
+        explicit = r"G_{%d} \leq " % order + r" \times ".join(notations)
+    if direct:
+        kind = "the direct product of its factors' groups"
+    elif direct is None:
+        kind = "a subdirect product of its factors' groups, possibly the direct product"
+    else:
+        kind = "a subdirect product of its factors' groups"
+    return {
+        "order": order,
+        "description": f"Galois group of order {'at most ' if bound else ''}{order} of {polynomial}, {kind}",
+        "structure": structure,
+        "transitive_label": None,
+        "explicit": explicit,
+        "direct_product": direct,
+        "order_bound": bound,
+        "proven": all(g.get("proven", True) for g in factor_groups) and not bound,
+        "method": "discriminants" if bound else "compositum",
+        "properties": product_group_properties(factor_groups)
+    }
+
+
+def compose_reducible(reducible, pool, mode="exact", root_digits=DEFAULT_ROOT_DIGITS, compute_splitting_field=False, kind="galois"):
+    """
+    Blocking: Galois information for a reducible polynomial from the `reducible_result` of its
+    factorization. Each distinct factor is served from the cache or computed concurrently on its
+    affinity worker, then the factor groups are combined on the worker holding the largest one
+    (see compose_galois_groups). Factors must be of degree at most MAX_HIGH_DEGREE (15); the
+    product may be of any degree the parser accepts.
+    """
+    polynomial = reducible["polynomial"]
+    factor_results, futures = {}, {}
+    for factor in reducible["factors"]:
+        key = factor["polynomial"]
+        if key in factor_results or key in futures:
+            continue
+        cached = result_cache.get("galois", galois_result_key(key, root_digits, mode=mode))
+        if cached is not None:
+            factor_results[key] = dict(cached, cache_hit=True)
+        else:
+            futures[key] = pool.submit(compute_galois_info, key, False, None, None, mode, root_digits,
+                                       affinity=key, budget=Budget.for_request(kind))
+    
+    for key, future in futures.items():
+        try:
+            result = dict(future.result())
+        except BudgetExceeded as e:
+            result = budget_failure(e, key)
+        if result.get("computation_successful") and result["galois_group"].get("proven", True):
+            result_cache.put("galois", galois_result_key(key, root_digits, mode=mode), result)
+        start_full_computation(result, key)
+        factor_results[key] = dict(result, cache_hit=False)
+    
+    factors = [dict(factor, galois_group=factor_results[factor["polynomial"]].get("galois_group"),
+                    roots=factor_results[factor["polynomial"]].get("roots"),
+                    cache_hit=factor_results[factor["polynomial"]].get("cache_hit"))
+               for factor in reducible["factors"]]
+    
+    for key, result in factor_results.items():
+        if not result.get("computation_successful"):
+            return {
+                "polynomial": polynomial,
+                "degree": reducible["degree"],
+                "is_irreducible": False,
+                "factors": factors,
+                "error": f"Factor {key}: {result.get('error')}",
+                "error_type": result.get("error_type"),
+                "computation_successful": False
+            }
+    
+    groups = {key: result["galois_group"] for key, result in factor_results.items()}
+    nontrivial = [key for key, group in groups.items() if group["order"] > 1]
+    anchor = max(nontrivial, key=lambda key: groups[key]["order"]) if nontrivial else None
+    future = pool.submit(compose_galois_groups, polynomial, nontrivial, [groups[key]["order"] for key in nontrivial],
+                         compute_splitting_field, affinity=anchor, budget=Budget.for_request(kind))
+    try:
+        composed = future.result()
+    except BudgetExceeded as e:
+        composed = budget_failure(e, polynomial)
+    if not composed.get("computation_successful"):
+        return dict(composed, is_irreducible=False, factors=factors)
+    
+    galois_group_info = product_galois_group(polynomial, [groups[key] for key in nontrivial], composed)
+    result = {
+        "polynomial": polynomial,
+        "degree": galois_group_info["order"],
+        "galois_group": galois_group_info,
+        "roots": [root for key in dict.fromkeys(f["polynomial"] for f in factors) for root in factor_results[key]["roots"]],
+        "is_irreducible": False,
+        "factors": factors,
+        "computation_successful": True,
+        "timings": composed.get("timings")
+    }
+    if compute_splitting_field:
+        result["splitting_field"] = composed["splitting_field"]
+    return result
+
+
+def run_cached(kind, fn, key):
+    """Job body: serve `kind` for canonical polynomial `key` from the cache, computing it on a miss."""
+    cached = result_cache.get(kind, key)
+    if cached is not None:
+        cached["cache_hit"] = True
+        metrics.observe(kind, cached)
+        return cached
+    
+    # Same worker as the Galois request for this polynomial, whose context it can reuse
+    result = run_in_pool(fn, key, budget=Budget.for_request(JOB_BUDGETS.get(kind, kind)), affinity=key)
+    if kind == "splitting_field" and result.get("error_type") == "reducible_polynomial":
+        # The compositum of the factors' splitting fields
+        composed = compose_reducible(result, worker_pool, compute_splitting_field=True, kind=kind)
+        result = {field: composed[field] for field in ("polynomial", "splitting_field", "factors", "error", "error_type",
+                                                       "computation_successful", "timings") if field in composed}
+    if result.get("computation_successful") and (result.get("galois_group") or {}).get("proven", True):
+        result_cache.put(kind, key, result)
+    result["cache_hit"] = False
+    metrics.observe(kind, result)
+    return result
+
+
+def classify_polynomials(polynomials: Iterable[str], pool: Optional[WorkerPool] = None, max_in_flight: Optional[int] = None):
+    """
+    Compute Galois information for many polynomials, yielding one result per input in completion order.
+    Inputs are deduplicated by canonical form, served from the cache where possible and
+    fanned out across the worker pool. Per-item failures are reported in the item's result.
+    Only proven groups are cached; an unproven degree 12-15 group starts its full computation.
+    """
+    owns_pool = pool is None
+    if owns_pool:
+        pool = WorkerPool()
+    max_in_flight = max_in_flight or 4 * pool.size
+    
+    waiting: Dict[str, list] = {}  # canonical form -> [(index, input), ...]
+    in_flight = {}  # future -> canonical form
+    
+    def item(index, polynomial_str, result):
+        return dict(result, index=index, input=polynomial_str)
+    
+    def finish(future):
+        key = in_flight.pop(future)
+        try:
+            result = dict(future.result())
+            result["queue_wait_seconds"] = future.queue_wait_seconds
+            if result.get("error_type") == "reducible_polynomial":
+                result = dict(compose_reducible(result, pool, kind="batch"), queue_wait_seconds=future.queue_wait_seconds)
+            if result.get("computation_successful"):
+                result["computation_time_seconds"] = future.run_seconds
+            start_full_computation(result, key)
+            if result.get("computation_successful") and result["galois_group"].get("proven", True):
+                result_cache.put("galois", galois_result_key(key), result)
+        except Exception as e:
+            result = budget_failure(e, key) or {"polynomial": key, "error": str(e), "computation_successful": False}
+        metrics.observe("batch", result)
+        for index, polynomial_str in waiting.pop(key):
+            yield item(index, polynomial_str, result)
+    
+    try:
+        for index, polynomial_str in enumerate(polynomials):
+            polynomial_str = polynomial_str.strip()
+            try:
+                coefficients = parse_coefficients(polynomial_str)
+            except PolynomialParseError as e:
+                yield item(index, polynomial_str, parse_error_result(polynomial_str, e))
+                continue
+            
+            unsupported = constant_polynomial_result(coefficients)
+            if unsupported is not None:
+                yield item(index, polynomial_str, unsupported)
+                continue
+            key = format_polynomial(monic(coefficients))
+            
+            if key in waiting:
+                waiting[key].append((index, polynomial_str))
+                continue
+            
+            cached = result_cache.get("galois", galois_result_key(key))
+            if cached is not None:
+                cached["cache_hit"] = True
+                metrics.observe("batch", cached)
+                yield item(index, polynomial_str, cached)
+                continue
+            
+            waiting[key] = [(index, polynomial_str)]
+            in_flight[pool.submit(compute_galois_info, key, budget=Budget.for_request("batch"))] = key
+            
+            while len(in_flight) >= max_in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from finish(future)
+        
+        while in_flight:
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from finish(future)
+    finally:
+        if owns_pool:
+            pool.shutdown()
+
+
+async def galois_result(parsed, key, mode="exact", root_digits=DEFAULT_ROOT_DIGITS, normalize=None):
+    """
+    Galois information for a parsed, non-constant polynomial with canonical form `key`: from the
+    result cache, or computed on the polynomial's worker (composed from its factors if reducible)
+    and cached when proven. The computation runs on `key`, so the cached result is the same
+    whichever spelling arrived first; only `polynomial` echoes the parsed input.
+    """
+    if normalize is None:
+        normalize = NORMALIZE_FIELDS_DEFAULT
+    result_key = galois_result_key(key, root_digits, normalize, mode)
+    result = result_cache.get("galois", result_key)
+    if result is not None:
+        result["polynomial"] = parsed
+        result["cache_hit"] = True
+        return result
+    
+    start_time = time.time()
+    reduced, field_entry = None, None
+    
+    if normalize:
+        # Tschirnhaus-equivalent inputs share one field-level entry for the group
+        reduced, _, _ = await worker_pool.run(reduce_defining_polynomial, key, affinity=key,
+                                           budget=Budget.for_request("galois"))
+        if isinstance(reduced, dict):
+            # polredabs ran out of budget: compute on the input itself, and leave the
+            # result uncached, since a normalized result carries `reduced_polynomial`
+            reduced, result_key = None, None
+        if reduced is not None:
+            field_key = reduced if mode == "exact" else f"{reduced}|mode={mode}"
+            field_entry = result_cache.get("field", field_key)
+    
+    known_group = field_entry["galois_group"] if field_entry else None
+    result, queue_wait, computation_time = await worker_pool.run(
+        compute_galois_info, key, False, reduced, known_group, mode, root_digits,
+        affinity=key, budget=Budget.for_request("galois")
+    )
+    if result.get("error_type") == "reducible_polynomial":
+        # Factored once; the factors run concurrently and their groups are composed
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, compose_reducible, result, worker_pool, mode, root_digits)
+        computation_time = time.time() - start_time - queue_wait
+    result["queue_wait_seconds"] = queue_wait
+    result["cache_hit"] = False
+    if reduced is not None:
+        result["field_cache_hit"] = field_entry is not None
+    
+    if result.get("computation_successful"):
+        result["computation_time_seconds"] = computation_time
+        if reduced is not None:
+            # Name the field's representative, as a field cache hit would, so the body does not depend on it
+            group = result["galois_group"] = dict(result["galois_group"])
+            group["description"] = group["description"].replace(result["polynomial"], reduced)
+    start_full_computation(result, key)
+    
+    # Probabilistic answers are never cached, so exact requests only ever see proven groups
+    if result.get("computation_successful") and result["galois_group"].get("proven", True) and result_key is not None:
+        result_cache.put("galois", result_key, result)
+        if reduced is not None and field_entry is None:
+            result_cache.put("field", field_key, {
+                "galois_group": result["galois_group"],
+                "splitting_field_degree": result["galois_group"]["order"]
+            })
+    result["polynomial"] = parsed
+    return result
+
+
+def submit_job(kind, polynomial_str):
+    """Start (or join) the background job for the canonical form of `polynomial_str`."""
+    if kind not in JOB_FUNCTIONS:
+        raise HTTPException(status_code=400, detail=f"Unknown job kind: {kind}")
+    try:
+        _, key = canonical_form(polynomial_str)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid polynomial: {str(e)}")
+    return job_manager.submit(kind, key, run_cached, kind, JOB_FUNCTIONS[kind], key)
+
+
+def start_full_computation(result, key):
+    """
+    If the tiered engine left a degree 12-15 group unproven, start (or join) the budgeted background
+    job for the full computation and report its id in the engine report. Returns the job or None.
+    """
+    engine = (result.get("galois_group") or {}).get("engine") or result.get("engine")
+    if not engine or not engine.get("pending_full_computation") or job_manager is None:
+        return None
+    job = submit_job("galois", key)
+    engine["job_id"] = job.job_id
+    return job
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
@@ -302,6 +1095,24 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def start_workers():
+    """Start the pre-warmed Sage worker pool and the job engine on top of it."""
+    global worker_pool, job_manager
+    corpus, table_degrees = warm_up_corpus(), warm_up_table_degrees()
+    worker_pool = WorkerPool(warm_up=(warm_up_worker, (corpus, table_degrees)))
+    job_manager = JobManager(ThreadPoolExecutor(max_workers=worker_pool.size, thread_name_prefix="galois-job"))
+    logger.info("Started %d workers; warm-up: %d polynomials, candidate tables for degrees %s",
+                worker_pool.size, len(corpus), table_degrees or "none")
+
+
+@app.on_event("shutdown")
+async def stop_workers():
+    job_manager.shutdown()
+    worker_pool.shutdown()
+    result_cache.close()
+
+
 @app.get("/")
 async def root():
     """Root endpoint with basic info."""
@@ -309,15 +1120,17 @@ async def root():
         "message": "Galois Playground Backend API",
         "version": "4.1.0",
         "backend": "FastAPI with Direct SageMath Import",
-        "sage_ready": True,
-        "max_polynomial_degree": 11,
+        "sage_ready": bool(worker_pool and worker_pool.ready),
+        "max_polynomial_degree": MAX_HIGH_DEGREE,
         "supported_features": [
             "Galois group computation for irreducible polynomials",
+            "Reducible polynomials composed from their irreducible factors",
             "Polynomial root calculation",
             "LaTeX group notation formatting",
             "Optional splitting field computation",
             "Separate API for splitting field calculations",
-            "Degree 1-11 polynomials supported"
+            "Irreducible polynomials and factors of degree 1-11 supported",
+            "Degrees 12-15 through resolvent certificates, with the full computation as a background job"
         ],
         "docs": "/docs"
     }
@@ -329,7 +1142,7 @@ async def test_endpoint():
     try:
         # Test with a simple polynomial computation
         start_time = time.time()
-        result = compute_galois_info("x^2 - 2")
+        result, _, _ = await worker_pool.run(compute_galois_info, "x^2 - 2")
         computation_time = time.time() - start_time
         
         if result.get("computation_successful"):
@@ -364,26 +1177,50 @@ async def compute_galois_endpoint(request: PolynomialRequest) -> ComputationResp
     if not poly_str:
         raise HTTPException(status_code=400, detail="Polynomial cannot be empty")
     
+    if request.mode not in ("exact", "fast"):
+        raise HTTPException(status_code=400, detail="Mode must be 'exact' or 'fast'")
+    
+    root_digits = request.root_digits if request.root_digits is not None else DEFAULT_ROOT_DIGITS
+    if not 0 <= root_digits <= MAX_ROOT_DIGITS:
+        raise HTTPException(status_code=400, detail=f"root_digits must be between 0 and {MAX_ROOT_DIGITS}")
+    
+    start_time = time.time()
     try:
-        start_time = time.time()
+        coefficients = parse_coefficients(poly_str)
+    except PolynomialParseError as e:
+        return ComputationResponse(**parse_error_result(poly_str, e))
+    
+    # Constants never reach a worker
+    unsupported = constant_polynomial_result(coefficients)
+    if unsupported is not None:
+        return ComputationResponse(**unsupported)
+    parsed, key = format_polynomial(coefficients), format_polynomial(monic(coefficients))
+    
+    try:
+        result = await galois_result(parsed, key, request.mode, root_digits, request.normalize_field)
         
-        result = compute_galois_info(poly_str, False)
-        computation_time = time.time() - start_time
+        metrics.observe("galois", result, time.time() - start_time)
+        if not request.include_timings:
+            result.pop("timings", None)
         
-        if result.get("computation_successful"):
-            result["computation_time_seconds"] = round(computation_time, 4)
-            
-            # If splitting field computation is requested, add a placeholder
-            if compute_sf:
-                result["splitting_field"] = {
-                    "field": "Computing...",
-                    "degree": None,
-                    "defining_polynomial": None,
-                    "description": "The splitting field computation is in progress",
-                    "computed": False,
-                    "computing": True
-                }
+        # If splitting field computation is requested, start a background job
+        if compute_sf and result.get("computation_successful"):
+            job = submit_job("splitting_field", poly_str)
+            result["splitting_field"] = {
+                "field": "Computing...",
+                "degree": None,
+                "defining_polynomial": None,
+                "description": "The splitting field computation is in progress",
+                "computed": False,
+                "computing": True,
+                "job_id": job.job_id
+            }
+        
+        return ComputationResponse(**result)
         
+    except BudgetExceeded as e:
+        result = budget_failure(e, parsed)
+        metrics.observe("galois", result, time.time() - start_time)
         return ComputationResponse(**result)
         
     except Exception as e:
@@ -393,6 +1230,189 @@ async def compute_galois_endpoint(request: PolynomialRequest) -> ComputationResp
         )
 
 
+def canonical_request(request: Request, polynomial: str):
+    """
+    Parse the `polynomial` query parameter of a content-addressed GET request. Returns
+    (parsed, canonical form, early response), where the early response is a permanent redirect
+    to the canonical URL for non-canonical spellings, or the error for unparseable and constant input.
+    """
+    try:
+        coefficients = parse_coefficients(polynomial.strip())
+    except PolynomialParseError as e:
+        return None, None, JSONResponse(parse_error_result(polynomial, e), status_code=400)
+    unsupported = constant_polynomial_result(coefficients)
+    if unsupported is not None:
+        return None, None, JSONResponse(unsupported, headers={"Cache-Control": NO_STORE})
+    parsed, key = format_polynomial(coefficients), format_polynomial(monic(coefficients))
+    if polynomial != key:
+        query = urlencode(dict(request.query_params, polynomial=key))
+        return parsed, key, RedirectResponse(f"{request.url.path}?{query}", status_code=308,
+                                             headers={"Cache-Control": IMMUTABLE})
+    return parsed, key, None
+
+
+def cacheable_response(request: Request, result, etag):
+    """The immutable, compressed response for a proven result, or an uncached one for anything else."""
+    if result.get("computation_successful") and (result.get("galois_group") or {}).get("proven", True):
+        body, encoding = encode(result, request.headers.get("accept-encoding"))
+        return Response(body, media_type="application/json", headers=cache_headers(etag, encoding))
+    return JSONResponse(representation(result), headers={"Cache-Control": NO_STORE})
+
+
+def not_modified(request: Request, etag):
+    """A 304 if the client already holds this representation, else None. Needs no cache lookup or worker."""
+    matched = matching_etag(request.headers.get("if-none-match"), etag)
+    if matched is None:
+        return None
+    return Response(status_code=304, headers=dict(cache_headers(etag), ETag=matched))
+
+
+@app.get("/api/galois")
+async def get_galois_endpoint(request: Request, polynomial: str, mode: str = "exact",
+                              root_digits: int = DEFAULT_ROOT_DIGITS):
+    """
+    Galois group information addressed by the canonical polynomial, cacheable by browsers and proxies.
+    Other spellings of the polynomial are redirected to the canonical URL.
+    """
+    if mode not in ("exact", "fast"):
+        raise HTTPException(status_code=400, detail="Mode must be 'exact' or 'fast'")
+    if not 0 <= root_digits <= MAX_ROOT_DIGITS:
+        raise HTTPException(status_code=400, detail=f"root_digits must be between 0 and {MAX_ROOT_DIGITS}")
+    
+    parsed, key, early = canonical_request(request, polynomial)
+    if early is not None:
+        return early
+    etag = strong_etag("galois", key, mode, str(root_digits), "polredabs" if NORMALIZE_FIELDS_DEFAULT else "")
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    
+    start_time = time.time()
+    try:
+        result = await galois_result(parsed, key, mode, root_digits)
+    except BudgetExceeded as e:
+        result = budget_failure(e, parsed)
+    metrics.observe("galois_get", result, time.time() - start_time)
+    return cacheable_response(request, result, etag)
+
+
+@app.post("/api/galois/batch")
+async def compute_galois_batch_endpoint(request: BatchRequest):
+    """Classify a list of polynomials, streaming NDJSON results in completion order."""
+    if not request.polynomials:
+        raise HTTPException(status_code=400, detail="Polynomial list cannot be empty")
+    
+    lines = (json.dumps(result) + "\n" for result in classify_polynomials(request.polynomials, worker_pool))
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+def server_sent_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.get("/api/galois/stream")
+async def stream_galois_endpoint(polynomial: str, compute_splitting_field: bool = False, mode: str = "exact",
+                                 root_digits: int = DEFAULT_ROOT_DIGITS):
+    """
+    Compute Galois information as a stream of server-sent events, one per stage as it completes:
+    parsed, irreducibility, group, roots, result, then splitting_field if requested, and done.
+    A failure at any stage is reported as a `failed` event, which ends the stream. (The name `error`
+    is avoided because EventSource also fires `error` for transport failures.)
+    """
+    poly_str = polynomial.strip()
+    if not poly_str:
+        raise HTTPException(status_code=400, detail="Polynomial cannot be empty")
+    if mode not in ("exact", "fast"):
+        raise HTTPException(status_code=400, detail="Mode must be 'exact' or 'fast'")
+    if not 0 <= root_digits <= MAX_ROOT_DIGITS:
+        raise HTTPException(status_code=400, detail=f"root_digits must be between 0 and {MAX_ROOT_DIGITS}")
+    
+    async def events():
+        start_time = time.time()
+        try:
+            coefficients = parse_coefficients(poly_str)
+        except PolynomialParseError as e:
+            yield server_sent_event("failed", parse_error_result(poly_str, e))
+            return
+        unsupported = constant_polynomial_result(coefficients)
+        if unsupported is not None:
+            yield server_sent_event("failed", unsupported)
+            return
+        
+        parsed, key = format_polynomial(coefficients), format_polynomial(monic(coefficients))
+        yield server_sent_event("parsed", {"polynomial": parsed, "canonical": key, "degree": len(coefficients) - 1})
+        
+        result_key = galois_result_key(key, root_digits, mode=mode)
+        try:
+            result = result_cache.get("galois", result_key)
+            if result is not None:
+                result.update(polynomial=parsed, cache_hit=True)
+                yield server_sent_event("irreducibility", {"is_irreducible": result.get("is_irreducible", True),
+                                                           "factors": result.get("factors")})
+                yield server_sent_event("group", {"galois_group": result["galois_group"], "degree": result["degree"]})
+                yield server_sent_event("roots", {"roots": result["roots"]})
+            else:
+                # Each stage runs on the worker holding this polynomial's context and continues its work
+                budget = Budget.for_request("galois")
+                for stage in ("irreducibility", "group", None):
+                    result, queue_wait, computation_time = await worker_pool.run(
+                        compute_galois_info, key, False, None, None, mode, root_digits, stage,
+                        affinity=key, budget=budget
+                    )
+                    if stage == "irreducibility" and result.get("error_type") == "reducible_polynomial":
+                        yield server_sent_event("irreducibility", {"is_irreducible": False, "factors": result["factors"]})
+                        result = await asyncio.get_running_loop().run_in_executor(
+                            None, compose_reducible, result, worker_pool, mode, root_digits)
+                        if result.get("computation_successful"):
+                            yield server_sent_event("group", {"galois_group": result["galois_group"], "degree": result["degree"],
+                                                              "factors": result["factors"]})
+                            yield server_sent_event("roots", {"roots": result["roots"]})
+                        computation_time = time.time() - start_time - queue_wait
+                    if not result.get("computation_successful"):
+                        start_full_computation(result, key)
+                        metrics.observe("galois_stream", result, time.time() - start_time)
+                        yield server_sent_event("failed", result)
+                        return
+                    if result.get("is_irreducible") is False:
+                        break
+                    if stage == "irreducibility":
+                        yield server_sent_event("irreducibility", {"is_irreducible": True})
+                    elif stage == "group":
+                        start_full_computation(result, key)
+                        yield server_sent_event("group", {"galois_group": result["galois_group"], "degree": result["degree"]})
+                    else:
+                        yield server_sent_event("roots", {"roots": result["roots"]})
+                
+                result.update(queue_wait_seconds=queue_wait, computation_time_seconds=computation_time, cache_hit=False)
+                if result["galois_group"].get("proven", True):
+                    result_cache.put("galois", result_key, result)
+                result["polynomial"] = parsed
+            
+            metrics.observe("galois_stream", result, time.time() - start_time)
+            result.pop("timings", None)
+            yield server_sent_event("result", result)
+            
+            if compute_splitting_field:
+                job = submit_job("splitting_field", poly_str)
+                yield server_sent_event("splitting_field_started", {"job_id": job.job_id})
+                splitting = dict(await asyncio.wrap_future(job.future))
+                splitting.pop("timings", None)
+                yield server_sent_event("splitting_field", dict(splitting, job_id=job.job_id))
+            
+            yield server_sent_event("done", {"total_seconds": round(time.time() - start_time, 4)})
+            
+        except BudgetExceeded as e:
+            result = budget_failure(e, parsed)
+            metrics.observe("galois_stream", result, time.time() - start_time)
+            yield server_sent_event("failed", result)
+        except Exception as e:
+            yield server_sent_event("failed", {"polynomial": parsed, "error": str(e), "computation_successful": False})
+    
+    # No buffering anywhere between the worker and the browser
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(events(), media_type="text/event-stream", headers=headers)
+
+
 @app.post("/api/splitting-field")
 async def compute_splitting_field_endpoint(request: SplittingFieldRequest) -> SplittingFieldResponse:
     """Compute splitting field information for a given polynomial."""
@@ -401,13 +1421,14 @@ async def compute_splitting_field_endpoint(request: SplittingFieldRequest) -> Sp
     if not poly_str:
         raise HTTPException(status_code=400, detail="Polynomial cannot be empty")
     
+    job = submit_job("splitting_field", poly_str)
+    
     try:
-        start_time = time.time()
-        result = compute_splitting_field(poly_str)
-        computation_time = time.time() - start_time
-        
-        if result.get("computation_successful"):
-            result["computation_time_seconds"] = round(computation_time, 4)
+        # Joins the running job instead of starting another splitting_field() call
+        result = dict(await asyncio.wrap_future(job.future))
+        result["job_id"] = job.job_id
+        if not request.include_timings:
+            result.pop("timings", None)
         
         return SplittingFieldResponse(**result)
         
@@ -418,16 +1439,118 @@ async def compute_splitting_field_endpoint(request: SplittingFieldRequest) -> Sp
         )
 
 
+@app.get("/api/splitting-field")
+async def get_splitting_field_endpoint(request: Request, polynomial: str):
+    """
+    Splitting field information addressed by the canonical polynomial, cacheable by browsers and proxies.
+    Joins the background job for the polynomial if one is running.
+    """
+    parsed, key, early = canonical_request(request, polynomial)
+    if early is not None:
+        return early
+    etag = strong_etag("splitting_field", key)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    
+    job = submit_job("splitting_field", key)
+    try:
+        result = dict(await asyncio.wrap_future(job.future))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Computation failed: {str(e)}"
+        )
+    return cacheable_response(request, result, etag)
+
+
+@app.post("/api/jobs")
+async def submit_job_endpoint(request: JobRequest):
+    """Submit a background computation, joining an identical job if one exists."""
+    poly_str = request.polynomial.strip()
+    
+    if not poly_str:
+        raise HTTPException(status_code=400, detail="Polynomial cannot be empty")
+    
+    return submit_job(request.kind, poly_str).to_dict()
+
+
+@app.get("/api/jobs/{job_id}")
+async def job_status_endpoint(job_id: str):
+    """Report the progress of a background job."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job id")
+    return job.to_dict()
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def job_result_endpoint(job_id: str):
+    """Return the finished result of a job, or its status while it is still running."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job id")
+    
+    status = job.to_dict()
+    if job.status in (JOB_COMPLETED, JOB_FAILED):
+        status["result"] = job.result
+    return status
+
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Latency histograms, request counters and pool/cache gauges in Prometheus text format."""
+    cache_stats = result_cache.stats()
+    extra = [
+        "# HELP galois_cache_lookups_total Result cache lookups by outcome.",
+        "# TYPE galois_cache_lookups_total counter",
+        f'galois_cache_lookups_total{{outcome="hit"}} {cache_stats["hits"]}',
+        f'galois_cache_lookups_total{{outcome="miss"}} {cache_stats["misses"]}',
+        "# HELP galois_cache_entries Entries in the in-memory result cache.",
+        "# TYPE galois_cache_entries gauge",
+        f"galois_cache_entries {cache_stats['memory_entries']}",
+    ]
+    if worker_pool is not None:
+        extra += [
+            "# HELP galois_pool_pending_tasks Tasks queued or running per worker process.",
+            "# TYPE galois_pool_pending_tasks gauge",
+        ]
+        extra += [f'galois_pool_pending_tasks{{worker="{i}"}} {n}' for i, n in enumerate(worker_pool.stats()["pending_tasks"])]
+    return PlainTextResponse(metrics.render(extra), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
+    """Liveness: the API process is serving. Use /ready to know whether workers can take traffic."""
+    stats = worker_pool.stats() if worker_pool else None
     return {
-        "status": "healthy", 
-        "backend": "FastAPI Direct SageMath",
-        "sage_imported": True
+        "status": "healthy",
+        "backend": "FastAPI with SageMath worker pool",
+        "ready": bool(worker_pool and worker_pool.ready),
+        # Only workers import Sage; count the ones that have done so and finished warming up
+        "sage_imported": bool(stats and stats["warm_workers"]),
+        "sage_imported_in_api_process": "sage.all" in sys.modules,
+        "uptime_seconds": round(time.time() - worker_pool.started_at, 3) if worker_pool else None,
+        "worker_pool": stats,
+        "cache": result_cache.stats()
+    }
+
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 200 once every worker has imported Sage and run the warm-up corpus, 503 before."""
+    ready = bool(worker_pool and worker_pool.ready)
+    stats = worker_pool.stats() if worker_pool else None
+    body = {
+        "ready": ready,
+        "workers": stats["workers"] if stats else 0,
+        "warm_workers": stats["warm_workers"] if stats else 0,
+        "warm_up": stats["warm_up"] if stats else [],
     }
+    return JSONResponse(body, status_code=200 if ready else 503)
 
 def test_sage_capabilities():
+    from sage.all import PolynomialRing, QQ, NumberField, sage_eval  # type: ignore
     R = PolynomialRing(QQ, 'x')
     x = R.gen()
 
@@ -447,9 +1570,10 @@ def test_sage_capabilities():
     print(f"Complex Roots: {complex_roots}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     print()
     print("Starting Galois Playground Backend")
-    print("Backend: FastAPI with direct SageMath import")
+    print("Backend: FastAPI with pre-warmed SageMath workers")
     print("Server: http://localhost:8001")
     print("API Docs: http://localhost:8001/docs")
     
@@ -458,6 +1582,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8001,
         reload=False,  # Disable reload to keep SageMath imported
-        workers=1,
+        workers=1,  # Sage work runs in the worker pool; size it with GALOIS_POOL_SIZE
         log_level="info"
     )
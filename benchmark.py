@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+
+"""
+Galois Playground benchmark harness
+Times compute_galois_info and compute_splitting_field over a corpus of polynomials
+for degrees 1-11 on a worker process under the request budgets, records per-stage
+cost and worker memory growth, and compares the run against a stored JSON baseline
+to flag regressions.
+
+Usage:
+    python benchmark.py run --save-baseline benchmarks/baseline.json
+    python benchmark.py run --baseline benchmarks/baseline.json --output benchmarks/latest.json
+    python benchmark.py run --degrees 8 9 10 --mode fast --no-splitting-field
+    python benchmark.py discover --degree 8 --attempts 500
+
+The corpus lives in benchmarks/corpus.json (degree -> list of polynomials). `discover`
+searches small random polynomials for transitive groups that the corpus does not cover
+yet (see CHM_LABEL_TO_TEX) and adds one example for each.
+"""
+
+import argparse
+import json
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from backend import compute_galois_info, compute_splitting_field
+from budgets import Budget
+from chm_label_to_tex import transitive_group_count
+from computation_context import clear_contexts
+from worker_pool import BudgetExceeded, WorkerPool, budget_failure
+
+
+DEFAULT_CORPUS = "benchmarks/corpus.json"
+DEFAULT_TOLERANCE = 0.25  # flag runs more than 25% slower than the baseline
+NOISE_FLOOR_SECONDS = 0.01  # ignore slowdowns smaller than this in absolute terms
+DEFAULT_MAX_CLOSURE_ORDER = 1000  # skip splitting fields of larger degree (S_7 already has 5040)
+
+
+def load_corpus(path: str, degrees: Optional[List[int]] = None) -> Dict[int, List[str]]:
+    with open(path) as f:
+        corpus = {int(degree): polynomials for degree, polynomials in json.load(f).items()}
+    if degrees:
+        corpus = {degree: corpus.get(degree, []) for degree in degrees}
+    return dict(sorted(corpus.items()))
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        from sage.version import version as sage_version  # type: ignore
+    except ImportError:
+        sage_version = None
+    return {
+        "python": platform.python_version(),
+        "sage": sage_version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def timed_call(fn, args: tuple, cold: bool) -> Dict[str, Any]:
+    """
+    Runs inside a worker: call `fn(*args)`, optionally after dropping the computation contexts,
+    and report its wall time and the growth of the worker's peak RSS, which unlike tracemalloc
+    includes the PARI and GAP heaps.
+    """
+    if cold:
+        clear_contexts()
+    maxrss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    result = fn(*args)
+    return {
+        "result": result,
+        "seconds": time.perf_counter() - start,
+        "maxrss_delta_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - maxrss_before,
+    }
+
+
+def measure(pool: WorkerPool, fn, args: tuple, repeat: int, budget: Budget) -> Dict[str, Any]:
+    """
+    Time `fn(*args)` `repeat` times on a pool worker under `budget`, each from a cold start: the
+    computation contexts are dropped before every call, so the median is what a new polynomial
+    costs and not a cache hit. One warm call follows for reference. A call that exceeds the
+    budget ends the measurement and is reported with its `error_type`.
+    """
+    durations = []
+    stage_samples = defaultdict(list)
+    result: Dict[str, Any] = {}
+    maxrss_delta_kb = 0
+    warm_seconds = None
+
+    for cold in [True] * repeat + [False]:
+        try:
+            call = pool.submit(timed_call, fn, args, cold, budget=budget).result()
+        except BudgetExceeded as e:
+            result = budget_failure(e, args[0])
+            break
+        result = call["result"]
+        if not result.get("computation_successful") and result.get("error_type") in ("timeout", "memory_exceeded"):
+            break
+        maxrss_delta_kb = max(maxrss_delta_kb, call["maxrss_delta_kb"])
+        if not cold:
+            warm_seconds = call["seconds"]
+            continue
+        durations.append(call["seconds"])
+        for span in (result.get("timings") or {}).get("stages", []):
+            stage_samples[span["stage"]].append(span["seconds"])
+
+    entry = {
+        "successful": bool(result.get("computation_successful")),
+        "error_type": result.get("error_type"),
+        "transitive_label": (result.get("galois_group") or {}).get("transitive_label"),
+        "order": (result.get("galois_group") or {}).get("order"),
+        "worker_maxrss_delta_kb": maxrss_delta_kb,
+    }
+    if len(durations) < repeat or warm_seconds is None:
+        return entry
+    return dict(entry, **{
+        "first_seconds": round(durations[0], 6),
+        "median_seconds": round(statistics.median(durations), 6),
+        "min_seconds": round(min(durations), 6),
+        "warm_seconds": round(warm_seconds, 6),
+        "stages": {stage: round(statistics.median(samples), 6) for stage, samples in stage_samples.items()},
+    })
+
+
+def run_benchmarks(corpus: Dict[int, List[str]], repeat: int, splitting_field: bool, mode: str,
+                   max_closure_order: int = DEFAULT_MAX_CLOSURE_ORDER) -> Dict[str, Any]:
+    """
+    Measure every corpus polynomial on a single worker process, with the request budgets.
+    Splitting fields whose Galois closure is larger than `max_closure_order` are recorded as skipped.
+    """
+    results = {}
+    pool = WorkerPool(size=1)
+    try:
+        for degree, polynomials in corpus.items():
+            for polynomial_str in polynomials:
+                entry = measure(pool, compute_galois_info, (polynomial_str, False, None, None, mode), repeat,
+                                Budget.for_request("galois"))
+                entry.update(kind="galois", degree=degree, polynomial=polynomial_str)
+                results[f"galois:{polynomial_str}"] = entry
+                print(f"  galois          deg {degree:>2}  {describe(entry)}  "
+                      f"{entry['transitive_label'] or entry['error_type']:<10} {polynomial_str}", file=sys.stderr)
+
+                if not splitting_field or not entry["successful"]:
+                    continue
+                if (entry["order"] or 0) > max_closure_order:
+                    entry = {"skipped": f"Galois closure of degree {entry['order']} > {max_closure_order}"}
+                else:
+                    entry = measure(pool, compute_splitting_field, (polynomial_str,), repeat,
+                                    Budget.for_request("splitting_field"))
+                entry.update(kind="splitting_field", degree=degree, polynomial=polynomial_str)
+                results[f"splitting_field:{polynomial_str}"] = entry
+                print(f"  splitting_field deg {degree:>2}  {describe(entry)}  "
+                      f"{'':<10} {polynomial_str}", file=sys.stderr)
+    finally:
+        pool.shutdown()
+
+    return {
+        "created_at": time.time(),
+        "environment": environment(),
+        "settings": {"repeat": repeat, "splitting_field": splitting_field, "mode": mode, "timing": "cold",
+                     "max_closure_order": max_closure_order},
+        "coverage": coverage(results),
+        "results": results,
+    }
+
+
+def describe(entry: Dict[str, Any]) -> str:
+    if "median_seconds" in entry:
+        return f"{entry['median_seconds']:>10.4f}s"
+    return f"{'skipped' if entry.get('skipped') else entry.get('error_type') or 'failed':>11}"
+
+
+def coverage(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Transitive groups reached per degree, out of the groups listed in CHM_LABEL_TO_TEX."""
+    labels = defaultdict(set)
+    for entry in results.values():
+        if entry["kind"] == "galois" and entry["transitive_label"]:
+            labels[entry["degree"]].add(entry["transitive_label"])
+    return {
+        str(degree): {"covered": sorted(labels[degree]), "total": transitive_group_count(degree)}
+        for degree in sorted(labels)
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Entries that got slower than the baseline (beyond tolerance and noise) or changed answer."""
+    regressions = []
+    for key, entry in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None or entry.get("skipped") or base.get("skipped"):
+            continue
+
+        if base["transitive_label"] != entry["transitive_label"] or base["successful"] != entry["successful"]:
+            regressions.append({
+                "key": key,
+                "reason": "result_changed",
+                "baseline": base["transitive_label"] or base["error_type"],
+                "current": entry["transitive_label"] or entry["error_type"],
+            })
+            continue
+
+        if "median_seconds" not in entry or "median_seconds" not in base:
+            continue
+        slowdown = entry["median_seconds"] - base["median_seconds"]
+        if base["median_seconds"] > 0 and entry["median_seconds"] > base["median_seconds"] * (1 + tolerance) and slowdown > NOISE_FLOOR_SECONDS:
+            slow_stages = {
+                stage: {"baseline": base["stages"].get(stage), "current": seconds}
+                for stage, seconds in entry["stages"].items()
+                if base["stages"].get(stage) is not None and seconds > base["stages"][stage] * (1 + tolerance)
+            }
+            regressions.append({
+                "key": key,
+                "reason": "slower",
+                "baseline_seconds": base["median_seconds"],
+                "current_seconds": entry["median_seconds"],
+                "ratio": round(entry["median_seconds"] / base["median_seconds"], 3),
+                "stages": slow_stages,
+            })
+    return regressions
+
+
+def discover(corpus_path: str, degree: int, attempts: int, max_coefficient: int, seed: Optional[int]) -> int:
+    """Search random monic polynomials for transitive groups the corpus does not cover yet."""
+    with open(corpus_path) as f:
+        corpus = json.load(f)
+    polynomials = corpus.setdefault(str(degree), [])
+
+    known = set()
+    for polynomial_str in polynomials:
+        label = (compute_galois_info(polynomial_str).get("galois_group") or {}).get("transitive_label")
+        if label:
+            known.add(label)
+    print(f"Degree {degree}: corpus covers {len(known)}/{transitive_group_count(degree)} groups", file=sys.stderr)
+
+    rng = random.Random(seed)
+    added = 0
+    for _ in range(attempts):
+        coefficients = [rng.randint(-max_coefficient, max_coefficient) for _ in range(degree)]
+        polynomial_str = f"x^{degree} + " + " + ".join(f"({c})*x^{i}" for i, c in enumerate(coefficients))
+        result = compute_galois_info(polynomial_str)
+        label = (result.get("galois_group") or {}).get("transitive_label")
+        if label and label not in known:
+            known.add(label)
+            polynomials.append(result["polynomial"])
+            added += 1
+            print(f"  {label:<8} {result['polynomial']}", file=sys.stderr)
+
+    with open(corpus_path, "w") as f:
+        json.dump(corpus, f, indent=2)
+        f.write("\n")
+    print(f"Added {added} polynomials; corpus now covers {len(known)}/{transitive_group_count(degree)} groups", file=sys.stderr)
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Galois group and splitting field computations.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="time the corpus and optionally compare against a baseline")
+    run_parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    run_parser.add_argument("--degrees", type=int, nargs="+", help="only benchmark these degrees")
+    run_parser.add_argument("--repeat", type=int, default=3, help="timed calls per polynomial (default: 3)")
+    run_parser.add_argument("--mode", choices=["exact", "fast"], default="exact")
+    run_parser.add_argument("--no-splitting-field", action="store_true", help="skip compute_splitting_field")
+    run_parser.add_argument("--max-closure-order", type=int, default=DEFAULT_MAX_CLOSURE_ORDER,
+                            help="skip splitting fields of larger degree (default: 1000)")
+    run_parser.add_argument("--output", help="write this run's results as JSON")
+    run_parser.add_argument("--save-baseline", help="write this run's results as the new baseline")
+    run_parser.add_argument("--baseline", help="compare against this baseline and exit 1 on regressions")
+    run_parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown ratio (default: 0.25)")
+
+    discover_parser = subparsers.add_parser("discover", help="add corpus examples for uncovered transitive groups")
+    discover_parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    discover_parser.add_argument("--degree", type=int, required=True)
+    discover_parser.add_argument("--attempts", type=int, default=200)
+    discover_parser.add_argument("--max-coefficient", type=int, default=5)
+    discover_parser.add_argument("--seed", type=int)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "discover":
+        return discover(args.corpus, args.degree, args.attempts, args.max_coefficient, args.seed)
+
+    corpus = load_corpus(args.corpus, args.degrees)
+    report = run_benchmarks(corpus, args.repeat, not args.no_splitting_field, args.mode, args.max_closure_order)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+                f.write("\n")
+
+    for degree, groups in report["coverage"].items():
+        print(f"Degree {degree}: {len(groups['covered'])}/{groups['total']} transitive groups covered", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("settings", {}).get("timing") != "cold":
+            print(f"{args.baseline} holds warm timings; record a new baseline to compare cold runs", file=sys.stderr)
+        regressions = compare(report, baseline, args.tolerance)
+        print(json.dumps({"regressions": regressions}, indent=2))
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}", file=sys.stderr)
+            return 1
+        print(f"No regressions against {args.baseline}", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Per-request time and memory budgets.
+Budgets are configured per request type through environment variables. Inside a
+worker, computations record whatever they have finished (group order, roots, ...)
+with record_partial(), so a computation that runs out of budget can still return it.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.environ.get(name, default))
+
+
+# Wall-clock seconds per request type
+TIME_BUDGETS = {
+    "galois": _env_float('GALOIS_TIME_BUDGET_GALOIS', 120),
+    "splitting_field": _env_float('GALOIS_TIME_BUDGET_SPLITTING_FIELD', 600),
+    "batch": _env_float('GALOIS_TIME_BUDGET_BATCH', 120),
+    "high_degree": _env_float('GALOIS_TIME_BUDGET_HIGH_DEGREE', 1800),
+}
+
+# Resident memory per request type, in megabytes
+MEMORY_BUDGETS_MB = {
+    "galois": _env_float('GALOIS_MEMORY_BUDGET_GALOIS_MB', 2000),
+    "splitting_field": _env_float('GALOIS_MEMORY_BUDGET_SPLITTING_FIELD_MB', 4000),
+    "batch": _env_float('GALOIS_MEMORY_BUDGET_BATCH_MB', 2000),
+    "high_degree": _env_float('GALOIS_MEMORY_BUDGET_HIGH_DEGREE_MB', 8000),
+}
+
+# How long past its budget a computation may run before its worker is killed outright
+HARD_KILL_GRACE_SECONDS = _env_float('GALOIS_HARD_KILL_GRACE_SECONDS', 5)
+
+# Error messages that mean PARI or Python ran out of memory
+MEMORY_ERROR_MARKERS = ("not enough memory", "stack overflows", "MemoryError", "cannot allocate memory")
+
+
+class Budget:
+    """Time and memory limits for one computation."""
+
+    def __init__(self, seconds: Optional[float] = None, memory_mb: Optional[float] = None):
+        self.seconds = seconds
+        self.memory_mb = memory_mb
+
+    @classmethod
+    def for_request(cls, kind: str) -> "Budget":
+        return cls(TIME_BUDGETS.get(kind), MEMORY_BUDGETS_MB.get(kind))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seconds": self.seconds, "memory_mb": self.memory_mb}
+
+
+_partial: Dict[str, Any] = {}
+
+
+def record_partial(**values):
+    """Remember intermediate results of the computation running in this worker."""
+    _partial.update(values)
+
+
+def reset_partial():
+    _partial.clear()
+
+
+def partial_results() -> Dict[str, Any]:
+    return dict(_partial)
+
+
+def is_memory_error(message: Optional[str]) -> bool:
+    return bool(message) and any(marker in message for marker in MEMORY_ERROR_MARKERS)
+
+
+def error_message(e: BaseException) -> str:
+    """The message of an exception, or its type when it has none (str(MemoryError()) is empty)."""
+    return str(e) or type(e).__name__
+
+
+def budget_exceeded_result(error_type: str, budget: Optional[Budget], polynomial: Optional[str] = None,
+                           partial: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Structured `timeout` / `memory_exceeded` error, carrying any partial results."""
+    if error_type == "timeout":
+        limit = f" of {budget.seconds:g}s" if budget and budget.seconds else ""
+        message = f"Computation exceeded its time budget{limit} and was cancelled."
+    else:
+        limit = f" of {budget.memory_mb:g} MB" if budget and budget.memory_mb else ""
+        message = f"Computation exceeded its memory budget{limit} and was cancelled."
+
+    partial = dict(partial or {})
+    return {
+        "polynomial": partial.pop("polynomial", polynomial),
+        "error": message,
+        "error_type": error_type,
+        "computation_successful": False,
+        "budget": budget.to_dict() if budget else None,
+        "partial_results": partial or None,
+    }
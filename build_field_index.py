@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+"""
+Galois Playground field index builder
+Writes proven Galois groups we have already computed into the memory-mapped
+index read by compute_galois_info (see field_index.py). Sources are the SQLite
+result cache (GALOIS_CACHE_PATH) and NDJSON output of classify_cli.py.
+
+Usage:
+    python build_field_index.py -o fields.idx --cache galois-cache.sqlite3
+    python build_field_index.py -o fields.idx --ndjson results.ndjson more.ndjson --merge
+    GALOIS_FIELD_INDEX=fields.idx ./start-backend.sh
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from field_index import FieldIndex, write_index
+from polynomial_parser import PolynomialParseError, canonical_form
+
+
+def proven_group(result: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+    """(transitive label, order) of a successful result with a proven group, else None."""
+    group = result.get("galois_group") or {}
+    if not (result.get("computation_successful", True) and group.get("proven", True)):
+        return None
+    if not group.get("transitive_label") or group.get("order") is None:
+        return None
+    return group["transitive_label"], int(group["order"])
+
+
+def entries_from_result(key: str, result: Dict[str, Any]) -> Iterator[Tuple[str, str, int]]:
+    group = proven_group(result)
+    if group is None:
+        return
+    yield (key, *group)
+    if result.get("reduced_polynomial"):
+        yield (result["reduced_polynomial"], *group)
+
+
+def entries_from_cache(path: str) -> Iterator[Tuple[str, str, int]]:
+    db = sqlite3.connect(path)
+    try:
+        for kind, key, value in db.execute("SELECT kind, key, value FROM results WHERE kind IN ('galois', 'field')"):
+            if "|" in key:
+                # Entries for non-default root precision repeat another entry's group
+                continue
+            yield from entries_from_result(key, json.loads(value))
+    finally:
+        db.close()
+
+
+def entries_from_ndjson(path: str) -> Iterator[Tuple[str, str, int]]:
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            try:
+                _, key = canonical_form(result.get("input") or result.get("polynomial") or "")
+            except PolynomialParseError:
+                continue
+            yield from entries_from_result(key, result)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the number field index from computed results.")
+    parser.add_argument("-o", "--output", required=True, help="index file to write")
+    parser.add_argument("--cache", action="append", default=[], help="SQLite result cache to read")
+    parser.add_argument("--ndjson", nargs="+", default=[], help="classify_cli.py output files to read")
+    parser.add_argument("--merge", action="store_true", help="keep the records already in the output index")
+    args = parser.parse_args(argv)
+
+    if not args.cache and not args.ndjson:
+        parser.error("give at least one --cache or --ndjson source")
+
+    existing = []
+    if args.merge and os.path.exists(args.output):
+        index = FieldIndex(args.output)
+        existing = list(index.records())
+        index.close()
+
+    def entries():
+        for path in args.cache:
+            yield from entries_from_cache(path)
+        for path in args.ndjson:
+            yield from entries_from_ndjson(path)
+
+    try:
+        count = write_index(args.output, entries(), existing)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Wrote {count} records to {args.output} ({len(existing)} kept from the previous index)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
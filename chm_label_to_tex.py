@@ -45,12 +45,42 @@ CHM_LABEL_TO_TEX = [
      '(A_5 \\times A_5) \\rtimes C_4', '(S_5 \\times S_5) \\wr C_2', 'A_{10}', 'S_{10}'],
     # Degree 11
     ['C_{11} \\cong \\mathbb{Z}/11\\mathbb{Z}', 'D_{11}', 'C_{11} \\rtimes C_5', 'F_{11} \\cong C_{11} \\rtimes C_{10}', '\\mathrm{PSL}(2, 11)', 'M_{11}', 'A_{11}', 'S_{11}'],
+    # Degree 12 (301 groups; only C_12, A_12 and S_12 are named, see _sparse_degree)
+    None,
+    # Degree 13
+    ['C_{13} \\cong \\mathbb{Z}/13\\mathbb{Z}', 'D_{13}', 'C_{13} \\rtimes C_3', 'C_{13} \\rtimes C_4', 'C_{13} \\rtimes C_6',
+     'F_{13} \\cong C_{13} \\rtimes C_{12}', '\\mathrm{PSL}(3, 3)', 'A_{13}', 'S_{13}'],
+    # Degree 14 (63 groups)
+    None,
+    # Degree 15 (104 groups)
+    None,
 ]
 
-def extract_group_notation(group, polynomial):
-    """Convert group description to proper LaTeX notation."""
+# Number of transitive groups of the degrees whose rows above are only sparsely named
+SPARSE_DEGREE_COUNTS = {12: 301, 14: 63, 15: 104}
+
+
+def _sparse_degree(degree, count):
+    """Row for a degree with many transitive groups: the cyclic group T1, A_n and S_n; None for the rest."""
+    return [f'C_{{{degree}}} \\cong \\mathbb{{Z}}/{degree}\\mathbb{{Z}}'] + [None] * (count - 3) + [f'A_{{{degree}}}', f'S_{{{degree}}}']
+
+
+for _degree, _count in SPARSE_DEGREE_COUNTS.items():
+    CHM_LABEL_TO_TEX[_degree - 1] = _sparse_degree(_degree, _count)
 
-    latex_str = CHM_LABEL_TO_TEX[int(polynomial.degree()) - 1][int(str(group).split()[2].split('T')[1]) - 1]
+MAX_TABLE_DEGREE = len(CHM_LABEL_TO_TEX)
 
-    # If no specific pattern matched, return the processed string or fallback
-    return latex_str if latex_str != None else f"G_{{{group.order()}}}"
\ No newline at end of file
+def transitive_group_count(degree):
+    """Number of transitive groups of the given degree covered by the table."""
+    return len(CHM_LABEL_TO_TEX[degree - 1])
+
+
+def transitive_group_notation(degree, t_number, order=None):
+    """LaTeX notation for the transitive group dTn, falling back to G_{order} for unnamed groups."""
+    latex_str = CHM_LABEL_TO_TEX[degree - 1][t_number - 1] if degree <= MAX_TABLE_DEGREE else None
+    return latex_str if latex_str != None else f"G_{{{order}}}"
+
+
+def extract_group_notation(group, polynomial):
+    """LaTeX notation for a Galois group, from its transitive group number."""
+    return transitive_group_notation(int(polynomial.degree()), int(group.transitive_number()), group.order())
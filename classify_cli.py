@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+
+"""
+Galois Playground command-line classifier
+Streams polynomials from a file (or stdin) through the same compute_galois_info
+pipeline as the API and writes one NDJSON result per input line.
+
+Input formats:
+    text    one polynomial per line
+    ndjson  one JSON object per line with a "polynomial" field (or a bare JSON string)
+    csv     a "polynomial" column, or the first column if there is no such header
+
+Usage:
+    python classify_cli.py polynomials.txt -o results.ndjson
+    python classify_cli.py polynomials.csv -o results.ndjson --resume
+    cat polynomials.txt | python classify_cli.py - > results.ndjson
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from typing import Iterator, Optional, Set
+
+from backend import classify_polynomials
+from worker_pool import WorkerPool
+
+
+def detect_format(path: str) -> str:
+    if path.endswith('.csv'):
+        return 'csv'
+    if path.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return 'text'
+
+
+def read_polynomials(stream, fmt: str) -> Iterator[str]:
+    """Lazily yield polynomial strings from the input stream, one per record."""
+    if fmt == 'csv':
+        reader = csv.reader(stream)
+        header = next(reader, None)
+        if header is None:
+            return
+        column = 0
+        if 'polynomial' in header:
+            column = header.index('polynomial')
+        else:
+            yield header[column]
+        for row in reader:
+            yield row[column] if len(row) > column else ''
+    elif fmt == 'ndjson':
+        for line in stream:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield record if isinstance(record, str) else str(record.get('polynomial', ''))
+    else:
+        for line in stream:
+            if line.strip():
+                yield line.rstrip('\n')
+
+
+class Checkpoint:
+    """
+    Progress of a run, persisted next to the output file.
+    Every index below `next_index` has been written, as have the indices in `done`
+    (results arrive in completion order, so a few may be ahead of the watermark).
+    `output_bytes` is the output size at the time of the checkpoint; on resume the
+    output is truncated back to it so no result is written twice.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.next_index = 0
+        self.done: Set[int] = set()
+        self.output_bytes = 0
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path) as f:
+            state = json.load(f)
+        self.next_index = state['next_index']
+        self.done = set(state['done'])
+        self.output_bytes = state['output_bytes']
+        return True
+
+    def mark(self, index: int):
+        self.done.add(index)
+        while self.next_index in self.done:
+            self.done.remove(self.next_index)
+            self.next_index += 1
+
+    def completed(self, index: int) -> bool:
+        return index < self.next_index or index in self.done
+
+    def save(self, output_bytes: int):
+        self.output_bytes = output_bytes
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'next_index': self.next_index,
+                'done': sorted(self.done),
+                'output_bytes': output_bytes,
+                'saved_at': time.time(),
+            }, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+def pending_inputs(polynomials: Iterator[str], checkpoint: Checkpoint, index_map: dict) -> Iterator[str]:
+    """Skip inputs finished in a previous run, remembering original indices of the rest."""
+    position = 0
+    for index, polynomial_str in enumerate(polynomials):
+        if checkpoint.completed(index):
+            continue
+        index_map[position] = index
+        position += 1
+        yield polynomial_str
+
+
+def run(input_path: str, output_path: Optional[str], fmt: Optional[str], resume: bool,
+        checkpoint_path: Optional[str], workers: Optional[int], max_in_flight: Optional[int],
+        checkpoint_every: int) -> int:
+    fmt = fmt or detect_format(input_path)
+
+    checkpoint = None
+    resumed = False
+    if output_path:
+        checkpoint = Checkpoint(checkpoint_path or output_path + '.checkpoint')
+        if resume and checkpoint.load():
+            resumed = True
+            # Drop anything written after the last checkpoint; it will be recomputed
+            with open(output_path, 'a') as f:
+                f.truncate(checkpoint.output_bytes)
+            print(f"Resuming from input {checkpoint.next_index} ({len(checkpoint.done)} later inputs already done)", file=sys.stderr)
+        elif resume:
+            print(f"No checkpoint at {checkpoint.path}; starting from the first input", file=sys.stderr)
+
+    source = sys.stdin if input_path == '-' else open(input_path, newline='')
+    # Without a checkpoint nothing in an existing output is accounted for, so it is overwritten
+    sink = sys.stdout if not output_path else open(output_path, 'a' if resumed else 'w')
+    pool = WorkerPool(size=workers)
+
+    written = 0
+    failed = 0
+    start_time = time.time()
+    index_map = {}
+    try:
+        polynomials = read_polynomials(source, fmt)
+        if checkpoint is not None:
+            polynomials = pending_inputs(polynomials, checkpoint, index_map)
+
+        for result in classify_polynomials(polynomials, pool, max_in_flight):
+            if checkpoint is not None:
+                result['index'] = index_map.pop(result['index'])
+            sink.write(json.dumps(result) + '\n')
+            written += 1
+            failed += 0 if result.get('computation_successful') else 1
+
+            if checkpoint is not None:
+                checkpoint.mark(result['index'])
+                if written % checkpoint_every == 0:
+                    sink.flush()
+                    os.fsync(sink.fileno())
+                    checkpoint.save(sink.tell())
+
+        if checkpoint is not None:
+            sink.flush()
+            checkpoint.save(sink.tell())
+    finally:
+        pool.shutdown()
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    elapsed = time.time() - start_time
+    print(f"Classified {written} polynomials ({failed} failed) in {elapsed:.1f}s", file=sys.stderr)
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Classify Galois groups of polynomials from a file, writing NDJSON results.")
+    parser.add_argument('input', help="input file, or - for stdin")
+    parser.add_argument('-o', '--output', help="output NDJSON file (default: stdout; required for --resume)")
+    parser.add_argument('--format', choices=['text', 'ndjson', 'csv'], help="input format (default: from file extension)")
+    parser.add_argument('--resume', action='store_true', help="continue an interrupted run from its checkpoint")
+    parser.add_argument('--checkpoint', help="checkpoint file (default: OUTPUT.checkpoint)")
+    parser.add_argument('--workers', type=int, help="worker processes (default: GALOIS_POOL_SIZE or CPU count)")
+    parser.add_argument('--max-in-flight', type=int, help="maximum queued computations (default: 4 per worker)")
+    parser.add_argument('--checkpoint-every', type=int, default=100, help="results between checkpoints (default: 100)")
+    args = parser.parse_args(argv)
+
+    if args.resume and not args.output:
+        parser.error("--resume requires --output")
+
+    return run(args.input, args.output, args.format, args.resume, args.checkpoint,
+               args.workers, args.max_in_flight, args.checkpoint_every)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Per-polynomial computation contexts.
+A context holds the Sage objects derived from one polynomial: its number field,
+Galois group and splitting field. Each is computed on first use and kept, so a
+splitting field request that follows a Galois group request for the same
+polynomial reuses the group's Galois closure instead of starting over.
+
+Contexts live in a small LRU inside each worker process. The API routes every
+request for a polynomial to the same worker (see WorkerPool affinity), so the
+context built by one request is there for the next.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from roots import format_roots
+
+
+CONTEXT_CACHE_SIZE = int(os.environ.get('GALOIS_CONTEXT_CACHE_SIZE', 16))
+
+
+class ComputationContext:
+    """Lazily computed Sage objects for one polynomial over Q."""
+
+    def __init__(self, poly):
+        self.poly = poly
+        self.uses = 0
+        self._is_irreducible = None
+        self._number_field = None
+        self._galois_group = None
+        self._splitting_field = None
+        self._roots: Dict[int, List[str]] = {}
+        # Group info as reported to clients, by (mode, reduced polynomial)
+        self.group_info: Dict[Any, Dict[str, Any]] = {}
+
+    def is_irreducible(self) -> bool:
+        if self._is_irreducible is None:
+            self._is_irreducible = bool(self.poly.is_irreducible())
+        return self._is_irreducible
+
+    def number_field(self):
+        if self._number_field is None:
+            from sage.rings.number_field.number_field import NumberField  # type: ignore
+            self._number_field = NumberField(self.poly, names=('a',))
+        return self._number_field
+
+    def galois_group(self):
+        if self._galois_group is None:
+            # The closure generator is named b, matching poly.splitting_field('b').
+            # PARI's tables stop at degree 11; GAP identifies transitive groups up to degree 15 and beyond
+            algorithm = 'pari' if self.poly.degree() <= 11 else 'gap'
+            self._galois_group = self.number_field().galois_group(names='b', algorithm=algorithm)
+        return self._galois_group
+
+    def splitting_field(self):
+        """The Galois closure of the number field, shared with the Galois group computation."""
+        if self._splitting_field is None:
+            self._splitting_field = self.galois_group().splitting_field()
+        return self._splitting_field
+
+    def roots(self, digits: int) -> List[str]:
+        if digits not in self._roots:
+            self._roots[digits] = format_roots(self.poly, digits)
+        return self._roots[digits]
+
+    def computed(self):
+        """Names of the parts already available without further work."""
+        parts = (("is_irreducible", self._is_irreducible), ("number_field", self._number_field),
+                 ("galois_group", self._galois_group or self.group_info or None),
+                 ("splitting_field", self._splitting_field), ("roots", self._roots or None))
+        return [name for name, value in parts if value is not None]
+
+
+_contexts: "OrderedDict[str, ComputationContext]" = OrderedDict()
+
+
+def get_context(key: str, poly) -> ComputationContext:
+    """
+    The context for canonical polynomial `key`, creating it from `poly` if this worker has none.
+    Polynomials with the same canonical key share a context.
+    """
+    context = _contexts.get(key)
+    if context is None:
+        context = ComputationContext(poly)
+        _contexts[key] = context
+        while len(_contexts) > CONTEXT_CACHE_SIZE:
+            _contexts.popitem(last=False)
+    else:
+        _contexts.move_to_end(key)
+    context.uses += 1
+    return context
+
+
+def clear_contexts():
+    """Drop every context of this worker, so the next computation of each polynomial starts cold."""
+    _contexts.clear()
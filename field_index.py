@@ -0,0 +1,118 @@
+"""
+Offline index of number fields with known Galois groups.
+The index is a compact binary file of fixed-size records sorted by a hash of the
+defining polynomial. Workers memory-map it and binary-search it, so a lookup costs
+a few microseconds and the pages are shared between all worker processes.
+
+Records are keyed by the canonical (monic) input polynomial and, where known, by
+its polredabs representative, which covers every polynomial defining the same
+field. Each record holds the transitive group dTn and the group order. Only
+proven results go into the index; build it with build_field_index.py.
+
+File layout (little endian):
+    header  8-byte magic, uint64 record count
+    record  16-byte BLAKE2b digest of the key, uint8 degree, pad, uint16 T-number, uint64 order
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Optional, Tuple
+
+
+MAGIC = b"GALFIDX1"
+HEADER = struct.Struct("<8sQ")
+RECORD = struct.Struct("<16sBxHQ")
+DIGEST_SIZE = 16
+
+
+def key_digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode(), digest_size=DIGEST_SIZE).digest()
+
+
+def parse_label(label: str) -> Tuple[int, int]:
+    """(degree, T-number) of a transitive group label such as "5T3"."""
+    degree, t_number = label.split("T")
+    return int(degree), int(t_number)
+
+
+class FieldIndex:
+    """Read-only, memory-mapped view of an index file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or len(self._map) != HEADER.size + self.count * RECORD.size:
+            self.close()
+            raise ValueError(f"{path} is not a field index")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _digest_at(self, i: int) -> bytes:
+        offset = HEADER.size + i * RECORD.size
+        return self._map[offset:offset + DIGEST_SIZE]
+
+    def lookup(self, key: str) -> Optional[Dict[str, int]]:
+        """The indexed group of polynomial `key` (in canonical printing), or None."""
+        digest = key_digest(key)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._digest_at(middle) < digest:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.count or self._digest_at(low) != digest:
+            return None
+        _, degree, t_number, order = RECORD.unpack_from(self._map, HEADER.size + low * RECORD.size)
+        return {"degree": degree, "t_number": t_number, "order": order, "transitive_label": f"{degree}T{t_number}"}
+
+    def records(self) -> Iterable[Tuple[bytes, int, int, int]]:
+        for i in range(self.count):
+            yield RECORD.unpack_from(self._map, HEADER.size + i * RECORD.size)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def write_index(path: str, entries: Iterable[Tuple[str, str, int]],
+                digests: Iterable[Tuple[bytes, int, int, int]] = ()) -> int:
+    """
+    Write an index from (key, transitive label, order) entries plus already hashed
+    (digest, degree, T-number, order) records. The file is replaced atomically, so
+    workers that have the old index mapped keep a consistent view.
+    Returns the number of records written.
+    """
+    records: Dict[bytes, Tuple[int, int, int]] = {digest: (degree, t, order) for digest, degree, t, order in digests}
+    for key, label, order in entries:
+        degree, t_number = parse_label(label)
+        digest = key_digest(key)
+        if records.get(digest, (degree, t_number, order)) != (degree, t_number, order):
+            raise ValueError(f"Conflicting groups for {key}: {records[digest]} and {(degree, t_number, order)}")
+        records[digest] = (degree, t_number, order)
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(records)))
+        for digest in sorted(records):
+            f.write(RECORD.pack(digest, *records[digest]))
+    os.replace(temporary, path)
+    return len(records)
+
+
+_default_index: Dict[str, Optional[FieldIndex]] = {}
+
+
+def default_index() -> Optional[FieldIndex]:
+    """The index named by GALOIS_FIELD_INDEX, opened once per process (None if unset or missing)."""
+    path = os.environ.get('GALOIS_FIELD_INDEX')
+    if not path:
+        return None
+    if path not in _default_index:
+        _default_index[path] = FieldIndex(path) if os.path.exists(path) else None
+    return _default_index[path]
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+"""
+Transitive group metadata.
+A table keyed by (degree, T-number) holding each transitive group's name, order,
+structural flags (solvable, abelian, nilpotent, primitive) and LaTeX notation.
+Responses use it to report properties such as solvability by radicals without
+any Sage group computation per request. It also holds the invariants the
+pre-screen compares against (cycle-type class sizes, evenness and orbit lengths
+on 2-sets), so they are computed once per deployment rather than once per worker.
+
+The table is a JSON file (GALOIS_GROUP_METADATA, by default group_metadata.json
+in the user's cache directory, outside the source tree) loaded on first use. Groups
+missing from it are computed once from GAP's transitive groups library and written
+back; writers serialize on a lock file next to it, so no process loses another's
+entries. Every worker precomputes the table during its warm-up (once the file is
+complete that is only a read); to do it ahead of deployment instead, run:
+    python group_metadata.py 1 2 3 4 5 6 7 8 9 10 11
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from chm_label_to_tex import transitive_group_notation
+from sage_runtime import import_sage
+
+try:
+    import fcntl
+except ImportError:  # not on POSIX: writes are only serialized within a process
+    fcntl = None
+
+
+DEFAULT_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser("~/.cache"),
+                            "galois-playground", "group_metadata.json")
+
+# Degrees the warm-up and `python group_metadata.py` precompute by default
+DEFAULT_DEGREES = list(range(1, 12))
+
+
+def compute_metadata(degree: int, t_number: int) -> Dict[str, Any]:
+    """Metadata of the transitive group degree T t_number, from GAP's library."""
+    import_sage()
+    from sage.libs.gap.libgap import libgap  # type: ignore
+
+    G = libgap.TransitiveGroup(degree, t_number)
+    order = int(G.Size())
+    points = list(range(1, degree + 1))
+    cycle_type_counts: Dict[str, int] = {}
+    for conjugacy_class in G.ConjugacyClasses():
+        lengths = sorted((int(n) for n in libgap.CycleLengths(conjugacy_class.Representative(), points)), reverse=True)
+        cycle_type = ",".join(str(n) for n in lengths)
+        cycle_type_counts[cycle_type] = cycle_type_counts.get(cycle_type, 0) + int(conjugacy_class.Size())
+    pairs = libgap.Combinations(points, 2)
+    return {
+        "name": str(G.Name()),
+        "order": order,
+        "solvable": bool(G.IsSolvableGroup()),
+        "abelian": bool(G.IsAbelian()),
+        "nilpotent": bool(G.IsNilpotentGroup()),
+        "primitive": bool(G.IsPrimitive()),
+        "latex": transitive_group_notation(degree, t_number, order),
+        "even": all(int(libgap.SignPerm(g)) == 1 for g in G.GeneratorsOfGroup()),
+        "cycle_type_counts": cycle_type_counts,
+        "two_set_orbits": sorted(int(n) for n in libgap.OrbitLengths(G, pairs, libgap.OnSets)) if degree > 1 else [],
+    }
+
+
+# Entries written before a field was added are recomputed
+FIELDS = ("name", "order", "solvable", "abelian", "nilpotent", "primitive", "latex",
+          "even", "cycle_type_counts", "two_set_orbits")
+
+
+def is_complete(entry: Optional[Dict[str, Any]]) -> bool:
+    return entry is not None and all(field in entry for field in FIELDS)
+
+
+class GroupMetadataTable:
+    """Lazily loaded (degree, T-number) -> metadata table, persisted as JSON."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[Tuple[int, int], Dict[str, Any]]] = None
+
+    def _read(self) -> Dict[Tuple[int, int], Dict[str, Any]]:
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {tuple(int(n) for n in label.split("T")): entry for label, entry in stored.items()}
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        """Serialize read-merge-write cycles across processes sharing the file."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(f"{self.path}.lock", "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _write(self):
+        """Merge our entries into the file. Must be called with the file lock held."""
+        entries = self._read()
+        entries.update(self._entries)
+        self._entries = entries
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as f:
+            json.dump({f"{d}T{t}": entries[d, t] for d, t in sorted(entries)}, f, indent=1)
+            f.write("\n")
+        os.replace(temporary, self.path)
+
+    def _save(self):
+        try:
+            with self._file_lock():
+                self._write()
+        except OSError:
+            # A read-only deployment still works, it just recomputes missing groups after restarts
+            pass
+
+    def get(self, degree: int, t_number: int) -> Dict[str, Any]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            entry = self._entries.get((degree, t_number))
+            if not is_complete(entry):
+                entry = compute_metadata(degree, t_number)
+                self._entries[degree, t_number] = entry
+                self._save()
+            return dict(entry)
+
+    def precompute(self, degrees: Iterable[int]) -> int:
+        """
+        Compute every missing group of the given degrees and write the file once. Returns the
+        group count. Holds the file lock throughout, so processes precomputing at the same time
+        wait for the first one and then find its entries.
+        """
+        import_sage()
+        from sage.libs.gap.libgap import libgap  # type: ignore
+
+        with self._lock:
+            try:
+                with self._file_lock():
+                    return self._precompute(degrees, libgap, save=True)
+            except OSError:
+                return self._precompute(degrees, libgap, save=False)
+
+    def _precompute(self, degrees: Iterable[int], libgap, save: bool) -> int:
+        self._entries = {**self._read(), **(self._entries or {})}
+        count, missing = 0, 0
+        for degree in degrees:
+            for t_number in range(1, int(libgap.NrTransitiveGroups(degree)) + 1):
+                if not is_complete(self._entries.get((degree, t_number))):
+                    self._entries[degree, t_number] = compute_metadata(degree, t_number)
+                    missing += 1
+                count += 1
+        if save and missing:
+            self._write()
+        return count
+
+
+_table = GroupMetadataTable(os.environ.get('GALOIS_GROUP_METADATA', DEFAULT_PATH))
+
+
+def group_metadata(degree: int, t_number: int) -> Dict[str, Any]:
+    """Metadata for the transitive group `degree`T`t_number`."""
+    return _table.get(degree, t_number)
+
+
+def precompute_metadata(degrees: Iterable[int] = DEFAULT_DEGREES) -> int:
+    """Fill the table for every transitive group of the given degrees. Returns the group count."""
+    return _table.precompute(degrees)
+
+
+def group_properties(degree: int, t_number: int) -> Dict[str, Any]:
+    """The response-facing subset of the metadata, including solvability by radicals."""
+    metadata = group_metadata(degree, t_number)
+    return {
+        "name": metadata["name"],
+        "solvable": metadata["solvable"],
+        "solvable_by_radicals": metadata["solvable"],
+        "abelian": metadata["abelian"],
+        "nilpotent": metadata["nilpotent"],
+        "primitive": metadata["primitive"],
+    }
+
+
+if __name__ == "__main__":
+    degrees = [int(arg) for arg in sys.argv[1:]] or DEFAULT_DEGREES
+    print(f"{_table.precompute(degrees)} groups in {_table.path}", file=sys.stderr)
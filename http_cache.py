@@ -0,0 +1,113 @@
+"""
+HTTP caching for the content-addressed GET endpoints.
+A proven result is a pure function of the canonical polynomial and the request
+options, so its representation never changes: responses carry a strong ETag
+derived from the canonical form and `Cache-Control: immutable`, and browsers
+or a reverse proxy (nginx proxy_cache) can serve repeat views without asking
+the API. Conditional requests are answered with 304 before any cache lookup
+or worker call. Bodies above GALOIS_COMPRESS_MIN_BYTES are gzip- or, when the
+optional brotli package is installed, brotli-compressed.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from result_cache import TRANSIENT_FIELDS
+
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+
+# Part of every ETag: bump it when the response format changes so clients drop their copies
+REPRESENTATION_VERSION = "1"
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+NO_STORE = "no-store"
+
+COMPRESS_MIN_BYTES = int(os.environ.get('GALOIS_COMPRESS_MIN_BYTES', 1024))
+
+
+def strong_etag(*parts: str) -> str:
+    """Quoted SHA-256 ETag of the canonical form and options identifying a representation."""
+    digest = hashlib.sha256("\0".join((REPRESENTATION_VERSION,) + parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """Each content coding is its own representation, so it gets its own strong ETag."""
+    return etag if encoding is None else f'{etag[:-1]}-{encoding}"'
+
+
+def matching_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """
+    The tag in an If-None-Match header that matches `etag` in any content coding, or None.
+    Uses the weak comparison If-None-Match calls for.
+    """
+    if not if_none_match:
+        return None
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return etag
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag or (tag.startswith(etag[:-1] + "-") and tag.endswith('"')):
+            return tag
+    return None
+
+
+def accepted_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """The preferred coding we can produce from an Accept-Encoding header: br, then gzip, else None."""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, parameters = item.strip().partition(";")
+        weight = 1.0
+        parameter = parameters.strip()
+        if parameter.startswith("q="):
+            try:
+                weight = float(parameter[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    for name in ("br", "gzip"):
+        if name == "br" and brotli is None:
+            continue
+        if weights.get(name, weights.get("*", 0.0)) > 0:
+            return name
+    return None
+
+
+def representation(result: Dict[str, Any]) -> Dict[str, Any]:
+    """The result without per-request fields, so every computation of it serializes identically."""
+    body = {key: value for key, value in result.items() if key not in TRANSIENT_FIELDS}
+    if body.get("factors"):
+        body["factors"] = [{key: value for key, value in factor.items() if key not in TRANSIENT_FIELDS}
+                           for factor in body["factors"]]
+    return body
+
+
+def encode(result: Dict[str, Any], accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """Serialize a result deterministically and compress it if it is large enough. Returns (body, coding)."""
+    body = json.dumps(representation(result), sort_keys=True, separators=(",", ":")).encode()
+    encoding = accepted_encoding(accept_encoding) if len(body) >= COMPRESS_MIN_BYTES else None
+    if encoding == "br":
+        body = brotli.compress(body)
+    elif encoding == "gzip":
+        # mtime=0 keeps the compressed bytes identical across responses, as a strong ETag promises
+        body = gzip.compress(body, mtime=0)
+    return body, encoding
+
+
+def cache_headers(etag: str, encoding: Optional[str] = None) -> Dict[str, str]:
+    """Headers of a cacheable response (or of the 304 answering a request for one)."""
+    headers = {"ETag": encoded_etag(etag, encoding), "Cache-Control": IMMUTABLE, "Vary": "Accept-Encoding"}
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return headers
@@ -0,0 +1,132 @@
+"""
+Background job engine for long-running polynomial computations.
+Each job is keyed by the canonical form of its polynomial, so duplicate
+submissions join the computation that is already queued or running.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class Job:
+    """A single background computation and its current state."""
+
+    def __init__(self, kind: str, key: str):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.key = key
+        self.status = JOB_QUEUED
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.future: Optional[Future] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JOB_COMPLETED, JOB_FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Status summary returned by the job endpoints."""
+        now = self.finished_at or time.time()
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "polynomial": self.key,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": round(now - self.submitted_at, 4),
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """Run computations in the background, one job per (kind, canonical polynomial)."""
+
+    def __init__(self, executor=None, max_finished_jobs: int = 256):
+        # SageMath/PARI is not thread safe, so the default executor runs one job at a time
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="galois-job")
+        self.max_finished_jobs = max_finished_jobs
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._by_key: Dict[tuple, str] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+
+    def submit(self, kind: str, key: str, fn: Callable[..., Dict[str, Any]], *args) -> Job:
+        """Start a job for `key`, or return the existing job if one is running or finished."""
+        with self._lock:
+            existing_id = self._by_key.get((kind, key))
+            if existing_id is not None:
+                existing = self._jobs[existing_id]
+                if existing.status != JOB_FAILED:
+                    return existing
+                self._forget(existing_id)
+
+            job = Job(kind, key)
+            self._jobs[job.job_id] = job
+            self._by_key[(kind, key)] = job.job_id
+            job.future = self.executor.submit(self._run, job, fn, *args)
+            return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def find(self, kind: str, key: str) -> Optional[Job]:
+        with self._lock:
+            job_id = self._by_key.get((kind, key))
+            return self._jobs.get(job_id) if job_id is not None else None
+
+    def _run(self, job: Job, fn: Callable[..., Dict[str, Any]], *args) -> Optional[Dict[str, Any]]:
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+        try:
+            result = fn(*args)
+            job.result = result
+            if result.get("computation_successful"):
+                job.status = JOB_COMPLETED
+            else:
+                job.status = JOB_FAILED
+                job.error = result.get("error")
+        except Exception as e:
+            job.status = JOB_FAILED
+            job.error = str(e)
+            job.result = {
+                "polynomial": job.key,
+                "error": str(e),
+                "computation_successful": False
+            }
+        finally:
+            job.finished_at = time.time()
+            self._retire(job)
+        return job.result
+
+    def _retire(self, job: Job):
+        """Keep a bounded number of finished jobs around for result lookups."""
+        with self._lock:
+            self._finished[job.job_id] = None
+            while len(self._finished) > self.max_finished_jobs:
+                oldest_id, _ = self._finished.popitem(last=False)
+                self._forget(oldest_id)
+
+    def _forget(self, job_id: str):
+        job = self._jobs.pop(job_id, None)
+        self._finished.pop(job_id, None)
+        if job is not None and self._by_key.get((job.kind, job.key)) == job_id:
+            del self._by_key[(job.kind, job.key)]
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
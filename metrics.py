@@ -0,0 +1,163 @@
+"""
+Per-stage timing and Prometheus-style metrics.
+Workers record a StageTimer for each computation and return it with the result;
+the API process aggregates those spans into latency histograms exposed at /metrics.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class StageTimer:
+    """Lap timer: each call to lap() records the time spent since the previous lap."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.stages: List[Dict[str, Any]] = []
+
+    def lap(self, stage: str):
+        now = time.perf_counter()
+        self.stages.append({"stage": stage, "seconds": round(now - self._last, 6)})
+        self._last = now
+
+    def skip(self):
+        """Discard time spent since the last lap (e.g. bookkeeping that is not a stage)."""
+        self._last = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": self.stages,
+            "total_seconds": round(self._last - self.started, 6),
+        }
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label values, in the Prometheus data model."""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+
+    def observe(self, value: float, *label_values):
+        series = self._series.setdefault(tuple(str(v) for v in label_values), {
+            "counts": [0] * len(self.buckets),
+            "sum": 0.0,
+            "count": 0,
+        })
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series["counts"][i] += 1
+        series["sum"] += value
+        series["count"] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for label_values, series in sorted(self._series.items()):
+            labels = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(self.label_names, label_values))
+            prefix = labels + "," if labels else ""
+            for bound, count in zip(self.buckets, series["counts"]):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {series["count"]}')
+            lines.append(f"{self.name}_sum{{{labels}}} {series['sum']:.6f}")
+            lines.append(f"{self.name}_count{{{labels}}} {series['count']}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter keyed by label values."""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values, amount: float = 1):
+        key = tuple(str(v) for v in label_values)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self._values.items()):
+            labels = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(self.label_names, label_values))
+            lines.append(f"{self.name}{{{labels}}} {value}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def result_labels(result: Dict[str, Any]) -> Tuple[str, str]:
+    """(degree, transitive group) labels for a computation result."""
+    label = (result.get("galois_group") or {}).get("transitive_label")
+    if label and "T" in label:
+        return label.split("T")[0], label
+    degree = result.get("degree")
+    return (str(degree) if degree is not None else "unknown"), "none"
+
+
+class MetricsRegistry:
+    """All metrics exported by the API process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.request_seconds = Histogram(
+            "galois_request_seconds",
+            "End-to-end computation latency by endpoint, polynomial degree and transitive group.",
+            ("endpoint", "degree", "group"),
+        )
+        self.stage_seconds = Histogram(
+            "galois_stage_seconds",
+            "Latency of individual computation stages.",
+            ("stage", "degree", "group"),
+        )
+        self.queue_wait_seconds = Histogram(
+            "galois_queue_wait_seconds",
+            "Time spent waiting for a free worker process.",
+            ("endpoint",),
+        )
+        self.requests = Counter(
+            "galois_requests_total",
+            "Computations by endpoint and outcome.",
+            ("endpoint", "outcome"),
+        )
+
+    def observe(self, endpoint: str, result: Dict[str, Any], seconds: Optional[float] = None):
+        """Record one computation result, including its per-stage timings if it has any."""
+        degree, group = result_labels(result)
+        if result.get("cache_hit"):
+            outcome = "cache_hit"
+        elif result.get("computation_successful"):
+            outcome = "success"
+        else:
+            outcome = result.get("error_type") or "error"
+
+        timings = result.get("timings") or {}
+        if seconds is None:
+            seconds = timings.get("total_seconds")
+
+        with self._lock:
+            self.requests.inc(endpoint, outcome)
+            if seconds is not None:
+                self.request_seconds.observe(seconds, endpoint, degree, group)
+            if result.get("queue_wait_seconds") is not None:
+                self.queue_wait_seconds.observe(result["queue_wait_seconds"], endpoint)
+            for span in timings.get("stages", []):
+                self.stage_seconds.observe(span["seconds"], span["stage"], degree, group)
+
+    def render(self, extra_lines: Optional[List[str]] = None) -> str:
+        with self._lock:
+            lines = []
+            for metric in (self.requests, self.request_seconds, self.stage_seconds, self.queue_wait_seconds):
+                lines.extend(metric.render())
+        lines.extend(extra_lines or [])
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,244 @@
+"""
+Lightweight parser for univariate polynomials over Q.
+Turns input like "3x^2 - (x+1)(x-1)/2" straight into a list of exact rational
+coefficients (constant term first) without touching Sage, so malformed or
+oversized inputs are rejected before any worker process is involved. Input
+length, degree and coefficient height are checked as the expression is built,
+which keeps even hostile inputs such as "(x+1)^100000" cheap to reject.
+"""
+
+import os
+import re
+from fractions import Fraction
+from typing import List, Tuple
+
+
+MAX_INPUT_LENGTH = int(os.environ.get('GALOIS_MAX_INPUT_LENGTH', 10000))
+MAX_DEGREE = int(os.environ.get('GALOIS_MAX_PARSE_DEGREE', 64))
+MAX_COEFFICIENT_BITS = int(os.environ.get('GALOIS_MAX_COEFFICIENT_BITS', 4096))
+
+_TOKEN = re.compile(r"\s*(?:(\d+(?:\.\d*)?|\.\d+)|(\*\*|[-+*/^()x]))")
+
+
+class PolynomialParseError(ValueError):
+    """The input is not a polynomial in x with rational coefficients."""
+
+    error_type = "parse_error"
+
+
+class PolynomialTooLarge(PolynomialParseError):
+    """The input is a polynomial, but too long, of too high a degree or with too large coefficients."""
+
+    error_type = "input_too_large"
+
+
+def _tokenize(text: str) -> List[Tuple[str, str, int]]:
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            offset = len(text) - len(text[position:].lstrip())
+            raise PolynomialParseError(f"Unexpected character {text[offset]!r} at position {offset + 1}")
+        number, symbol = match.groups()
+        tokens.append(("number", number, match.start(1)) if number else ("symbol", symbol, match.start(2)))
+        position = match.end()
+    return tokens
+
+
+def _trim(coefficients: List[Fraction]) -> List[Fraction]:
+    while coefficients and coefficients[-1] == 0:
+        coefficients.pop()
+    return coefficients
+
+
+def _check_size(coefficients: List[Fraction]) -> List[Fraction]:
+    if len(coefficients) - 1 > MAX_DEGREE:
+        raise PolynomialTooLarge(f"Polynomial degree exceeds the limit of {MAX_DEGREE}")
+    for c in coefficients:
+        if max(c.numerator.bit_length(), c.denominator.bit_length()) > MAX_COEFFICIENT_BITS:
+            raise PolynomialTooLarge(f"Coefficients exceed the limit of {MAX_COEFFICIENT_BITS} bits")
+    return coefficients
+
+
+def _add(a: List[Fraction], b: List[Fraction], sign: int = 1) -> List[Fraction]:
+    result = list(a) + [Fraction(0)] * (len(b) - len(a))
+    for i, c in enumerate(b):
+        result[i] += sign * c
+    return _check_size(_trim(result))
+
+
+def _multiply(a: List[Fraction], b: List[Fraction]) -> List[Fraction]:
+    if not a or not b:
+        return []
+    if len(a) + len(b) - 2 > MAX_DEGREE:
+        raise PolynomialTooLarge(f"Polynomial degree exceeds the limit of {MAX_DEGREE}")
+    result = [Fraction(0)] * (len(a) + len(b) - 1)
+    for i, c in enumerate(a):
+        if c:
+            for j, d in enumerate(b):
+                result[i + j] += c * d
+    return _check_size(_trim(result))
+
+
+class _Parser:
+    """
+    Recursive descent over the grammar
+        expression := ['+' | '-'] term (('+' | '-') term)*
+        term       := factor (['*' | '/'] factor)*        (a missing '*' means multiplication)
+        factor     := ('+' | '-') factor | atom [('^' | '**') factor]
+        atom       := number | 'x' | '(' expression ')'
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.index = 0
+
+    def peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def take(self):
+        token = self.peek()
+        self.index += 1
+        return token
+
+    def error(self, message: str) -> PolynomialParseError:
+        token = self.peek()
+        where = f"at position {token[2] + 1}" if token else "at end of input"
+        return PolynomialParseError(f"{message} {where}")
+
+    def parse(self) -> List[Fraction]:
+        if not self.tokens:
+            raise PolynomialParseError("Polynomial cannot be empty")
+        result = self.expression()
+        if self.peek() is not None:
+            raise self.error(f"Unexpected {self.peek()[1]!r}")
+        return result
+
+    def expression(self) -> List[Fraction]:
+        result = self.term()
+        while self.peek() and self.peek()[1] in ("+", "-"):
+            sign = 1 if self.take()[1] == "+" else -1
+            result = _add(result, self.term(), sign)
+        return result
+
+    def term(self) -> List[Fraction]:
+        result = self.factor()
+        while True:
+            token = self.peek()
+            if token and token[1] == "*":
+                self.take()
+                result = _multiply(result, self.factor())
+            elif token and token[1] == "/":
+                self.take()
+                divisor = self.factor()
+                if len(divisor) != 1:
+                    raise PolynomialParseError("Division is only supported by nonzero constants")
+                result = _check_size([c / divisor[0] for c in result])
+            elif token and (token[0] == "number" or token[1] in ("x", "(")):
+                result = _multiply(result, self.factor())
+            else:
+                return result
+
+    def factor(self) -> List[Fraction]:
+        token = self.peek()
+        if token and token[1] in ("+", "-"):
+            self.take()
+            value = self.factor()
+            return value if token[1] == "+" else [-c for c in value]
+
+        base = self.atom()
+        token = self.peek()
+        if not (token and token[1] in ("^", "**")):
+            return base
+
+        self.take()
+        exponent = self.factor()
+        if len(exponent) > 1 or (exponent and exponent[0].denominator != 1):
+            raise PolynomialParseError("Exponents must be integers")
+        power = int(exponent[0]) if exponent else 0
+        if power < 0:
+            if len(base) != 1:
+                raise PolynomialParseError("Negative exponents are only supported on nonzero constants")
+            base, power = [1 / base[0]], -power
+        if not base:
+            return [] if power else [Fraction(1)]
+        if len(base) == 1:
+            # |n|^p has at least p * (bits(n) - 1) bits, so the height check needs no exponentiation
+            c = base[0]
+            if (max(abs(c.numerator).bit_length(), c.denominator.bit_length()) - 1) * power > MAX_COEFFICIENT_BITS:
+                raise PolynomialTooLarge(f"Coefficients exceed the limit of {MAX_COEFFICIENT_BITS} bits")
+            return _check_size([c ** power])
+        if (len(base) - 1) * power > MAX_DEGREE:
+            raise PolynomialTooLarge(f"Polynomial degree exceeds the limit of {MAX_DEGREE}")
+
+        result = [Fraction(1)]
+        for _ in range(power):
+            result = _multiply(result, base)
+        return result
+
+    def atom(self) -> List[Fraction]:
+        token = self.take()
+        if token is None:
+            self.index -= 1
+            raise self.error("Expected a number, 'x' or '('")
+        kind, value, _ = token
+        if kind == "number":
+            return _check_size(_trim([Fraction(value)]))
+        if value == "x":
+            return [Fraction(0), Fraction(1)]
+        if value == "(":
+            result = self.expression()
+            if not (self.peek() and self.peek()[1] == ")"):
+                raise self.error("Expected ')'")
+            self.take()
+            return result
+        self.index -= 1
+        raise self.error(f"Unexpected {value!r}")
+
+
+def parse_coefficients(polynomial_str: str) -> List[Fraction]:
+    """Rational coefficients of the polynomial, constant term first ([] for the zero polynomial)."""
+    if len(polynomial_str) > MAX_INPUT_LENGTH:
+        raise PolynomialTooLarge(f"Input is longer than {MAX_INPUT_LENGTH} characters")
+    return _Parser(polynomial_str).parse()
+
+
+def degree(coefficients: List[Fraction]) -> int:
+    return len(coefficients) - 1
+
+
+def monic(coefficients: List[Fraction]) -> List[Fraction]:
+    """The monic associate of a nonconstant polynomial; constants are returned unchanged."""
+    if degree(coefficients) < 1:
+        return list(coefficients)
+    lead = coefficients[-1]
+    return [c / lead for c in coefficients]
+
+
+def format_polynomial(coefficients: List[Fraction], variable: str = "x") -> str:
+    """Print the polynomial the way Sage prints elements of QQ[x], e.g. "x^3 - 1/2*x + 3"."""
+    terms = []
+    for k in range(len(coefficients) - 1, -1, -1):
+        c = coefficients[k]
+        if c == 0:
+            continue
+        magnitude = abs(c)
+        if k == 0:
+            body = str(magnitude)
+        else:
+            monomial = variable if k == 1 else f"{variable}^{k}"
+            body = monomial if magnitude == 1 else f"{magnitude}*{monomial}"
+        if not terms:
+            terms.append(f"-{body}" if c < 0 else body)
+        else:
+            terms.append(f"- {body}" if c < 0 else f"+ {body}")
+    return " ".join(terms) if terms else "0"
+
+
+def canonical_form(polynomial_str: str) -> Tuple[str, str]:
+    """(printed form, printed monic form) of the input, without building any Sage object."""
+    coefficients = parse_coefficients(polynomial_str)
+    return format_polynomial(coefficients), format_polynomial(monic(coefficients))
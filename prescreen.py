@@ -0,0 +1,195 @@
+"""
+Cheap Galois group pre-screening.
+Uses the discriminant (is the group inside A_n?) and the factorization of the
+polynomial modulo many small unramified primes. By Chebotarev, the degrees of the
+factors mod p are the cycle type of a Frobenius element, so the sampled cycle types
+are genuine elements of the Galois group, occurring with frequencies close to their
+densities in the group. That is often enough to pin the group down without calling
+NumberField.galois_group().
+"""
+
+import functools
+import math
+import os
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+from sage.arith.misc import next_prime  # type: ignore
+from sage.groups.perm_gps.permgroup_named import TransitiveGroups  # type: ignore
+from sage.rings.finite_rings.finite_field_constructor import GF  # type: ignore
+from sage.rings.integer_ring import ZZ  # type: ignore
+
+from chm_label_to_tex import MAX_TABLE_DEGREE, transitive_group_count, transitive_group_notation
+from group_metadata import group_metadata
+from resolvents import two_set_orbit_lengths
+
+
+DEFAULT_PRIMES = int(os.environ.get('GALOIS_PRESCREEN_PRIMES', 60))
+DEFAULT_CONFIDENCE = float(os.environ.get('GALOIS_PRESCREEN_CONFIDENCE', 0.99))
+
+
+def integral_model(poly):
+    """Scale a polynomial over Q to a primitive polynomial over Z with the same roots."""
+    f = (poly * poly.denominator()).change_ring(ZZ)
+    return f // f.content()
+
+
+def frobenius_cycle_types(poly, num_primes: int = DEFAULT_PRIMES) -> Counter:
+    """Count the cycle types of Frobenius at the first `num_primes` unramified primes."""
+    f = integral_model(poly)
+    bad = f.discriminant() * f.leading_coefficient()
+    counts: Counter = Counter()
+    p = 2
+    while sum(counts.values()) < num_primes:
+        if bad % p != 0:
+            degrees = [g.degree() for g, e in f.change_ring(GF(p)).factor() for _ in range(e)]
+            counts[tuple(sorted(degrees, reverse=True))] += 1
+        p = int(next_prime(p))
+    return counts
+
+
+def contains_prime_cycle(cycle_type: Tuple[int, ...], n: int) -> bool:
+    """
+    True if some power of an element with this cycle type is a single p-cycle with p <= n - 3.
+    That needs exactly one cycle of prime length p and no other cycle length divisible by p.
+    """
+    for length in set(cycle_type):
+        if length < 2 or length > n - 3 or cycle_type.count(length) != 1 or not ZZ(length).is_prime():
+            continue
+        if all(other % length != 0 for other in cycle_type if other != length):
+            return True
+    return False
+
+
+def jordan_certificate(n: int, counts: Counter, discriminant_is_square: bool, primitive: bool = False) -> Optional[str]:
+    """
+    Prove that the group is A_n or S_n when the sampled elements allow it.
+    The group is transitive (irreducible input). It is primitive if n is prime, if it
+    contains an (n-1)-cycle, which makes it 2-transitive, or if the caller knows so from
+    a resolvent. By Jordan's theorem a primitive group containing a p-cycle with
+    p <= n - 3 contains A_n.
+    """
+    primitive = primitive or ZZ(n).is_prime() or (n - 1, 1) in counts
+    if not primitive or not any(contains_prime_cycle(t, n) for t in counts):
+        return None
+    return "A" if discriminant_is_square else "S"
+
+
+@functools.lru_cache(maxsize=None)
+def cycle_type_densities(n: int, t_number: int) -> Tuple[int, bool, Dict[Tuple[int, ...], float]]:
+    """Order, evenness and cycle-type distribution of the transitive group nTt, from the group metadata table."""
+    metadata = group_metadata(n, t_number)
+    order = metadata["order"]
+    densities = {tuple(int(c) for c in cycle_type.split(",")): count / order
+                 for cycle_type, count in metadata["cycle_type_counts"].items()}
+    return order, metadata["even"], densities
+
+
+def precompute_tables(degrees) -> int:
+    """
+    Load the cycle-type and 2-set orbit tables of every transitive group of the given degrees
+    from the group metadata table (computing them only if a first warm-up has not persisted them
+    yet), so the first request of each degree does not pay for them. Returns the group count.
+    """
+    count = 0
+    for n in degrees:
+        for t_number in range(1, int(TransitiveGroups(n).cardinality()) + 1):
+            cycle_type_densities(n, t_number)
+            two_set_orbit_lengths(n, t_number)
+            count += 1
+    return count
+
+
+def rank_candidates(n: int, counts: Counter, discriminant_is_square: bool,
+                    two_set_orbits: Optional[Tuple[int, ...]] = None):
+    """
+    Transitive groups consistent with the sample, best first, with posterior probabilities.
+    A group is consistent if it has every observed cycle type, lies in A_n exactly when
+    the discriminant is a square and, if given, has the 2-set orbit lengths of the
+    resolvent; consistent groups are scored by the likelihood of the sample.
+    """
+    scored = []
+    for t_number in range(1, int(TransitiveGroups(n).cardinality()) + 1):
+        order, is_even, densities = cycle_type_densities(n, t_number)
+        if is_even != discriminant_is_square or any(t not in densities for t in counts):
+            continue
+        if two_set_orbits is not None and two_set_orbit_lengths(n, t_number) != two_set_orbits:
+            continue
+        log_likelihood = sum(k * math.log(densities[t]) for t, k in counts.items())
+        scored.append((log_likelihood, t_number, order))
+
+    if not scored:
+        return []
+    best = max(s[0] for s in scored)
+    weights = [math.exp(s[0] - best) for s in scored]
+    total = sum(weights)
+    ranked = sorted(
+        ((t_number, order, weight / total) for (_, t_number, order), weight in zip(scored, weights)),
+        key=lambda c: -c[2],
+    )
+    return ranked
+
+
+def sample_invariants(poly, num_primes: int = DEFAULT_PRIMES) -> Tuple[bool, Counter]:
+    """(discriminant is a square, Frobenius cycle type counts) of an irreducible polynomial."""
+    return bool(poly.discriminant().is_square()), frobenius_cycle_types(poly, num_primes)
+
+
+def screen_sample(n: int, discriminant_is_square: bool, counts: Counter,
+                  two_set_orbits: Optional[Tuple[int, ...]] = None) -> Dict[str, Any]:
+    """
+    Identify the group from sampled invariants, optionally narrowed by the 2-set resolvent's
+    orbit lengths. An irreducible resolvent (a single orbit) also proves primitivity for Jordan.
+    """
+    summary = {
+        "discriminant_is_square": discriminant_is_square,
+        "primes_sampled": sum(counts.values()),
+        "cycle_types": {",".join(str(c) for c in t): k for t, k in sorted(counts.items())},
+    }
+    if two_set_orbits is not None:
+        summary["two_set_orbits"] = list(two_set_orbits)
+    resolvent = two_set_orbits is not None
+
+    primitive = resolvent and len(two_set_orbits) == 1
+    certificate = jordan_certificate(n, counts, discriminant_is_square, primitive) if n >= 5 else None
+    if certificate is not None:
+        # A_n and S_n are always the last two transitive groups of degree n
+        t_number = transitive_group_count(n) - (1 if certificate == "A" else 0) if n <= MAX_TABLE_DEGREE else None
+        order = math.factorial(n) // (2 if certificate == "A" else 1)
+        return dict(summary, **{
+            "transitive_label": f"{n}T{t_number}" if t_number else f"{certificate}{n}",
+            "t_number": t_number,
+            "order": order,
+            "explicit": transitive_group_notation(n, t_number, order) if t_number else f"{certificate}_{{{n}}}",
+            "proven": True,
+            "confidence": 1.0,
+            "method": "resolvent" if primitive else "jordan",
+            "candidates": 1,
+        })
+
+    ranked = rank_candidates(n, counts, discriminant_is_square, two_set_orbits)
+    method = "resolvent" if resolvent else "cycle_types"
+    if not ranked:
+        return dict(summary, proven=False, confidence=0.0, method=method, candidates=0)
+
+    t_number, order, posterior = ranked[0]
+    return dict(summary, **{
+        "transitive_label": f"{n}T{t_number}",
+        "t_number": t_number,
+        "order": order,
+        "explicit": transitive_group_notation(n, t_number, order),
+        "proven": len(ranked) == 1,
+        "confidence": 1.0 if len(ranked) == 1 else round(posterior, 6),
+        "method": method,
+        "candidates": len(ranked),
+    })
+
+
+def prescreen_galois_group(poly, num_primes: int = DEFAULT_PRIMES) -> Dict[str, Any]:
+    """
+    Identify the Galois group of an irreducible polynomial from cheap invariants.
+    The result is `proven` when the certificate is rigorous (Jordan's theorem, or a single
+    consistent transitive group); otherwise it is the most likely group with its posterior.
+    """
+    discriminant_is_square, counts = sample_invariants(poly, num_primes)
+    return screen_sample(int(poly.degree()), discriminant_is_square, counts)
@@ -0,0 +1,79 @@
+"""
+Resolvent certificates for Galois groups.
+The 2-set resolvent of f is R(x) = prod_{i<j} (x - (a_i + a_j)) over the roots a_i
+of f. When R is squarefree, the degrees of its irreducible factors over Q are the
+orbit lengths of the Galois group on unordered pairs of roots. Comparing them with
+the orbit lengths of each candidate transitive group rules candidates out, and an
+irreducible R shows the group is 2-homogeneous, hence primitive.
+
+R is computed without any number field: Res_y(f(y), f(x - y)) = 2^n f(x/2) R(x)^2
+for monic f, so only a resultant, an exact division and a factorization are needed.
+If R has repeated roots, f is first replaced by the minimal polynomial of a^2 + c*a
+(a Tschirnhaus transformation, which keeps the Galois action on the roots).
+"""
+
+import functools
+from typing import Optional, Tuple
+
+from group_metadata import group_metadata
+
+
+def tschirnhaus(poly, c: int):
+    """The characteristic polynomial of a^2 + c*a for a root a of `poly` (poly itself for c = 0)."""
+    if c == 0:
+        return poly
+    from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing  # type: ignore
+
+    P = PolynomialRing(poly.base_ring(), names=('x', 'y'))
+    x, y = P.gens()
+    f = sum(coefficient * y ** k for k, coefficient in enumerate(poly.list()))
+    return f.resultant(x - y ** 2 - c * y, y).univariate_polynomial(poly.parent()).monic()
+
+
+def two_set_factor_degrees(poly) -> Optional[Tuple[int, ...]]:
+    """Sorted degrees of the irreducible factors of the 2-set resolvent, or None if it is not squarefree."""
+    from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing  # type: ignore
+
+    f = poly.monic()
+    n = int(f.degree())
+    S = f.parent()
+    P = PolynomialRing(f.base_ring(), names=('x', 'y'))
+    x, y = P.gens()
+    coefficients = f.list()
+    f_y = sum(c * y ** k for k, c in enumerate(coefficients))
+    f_x_minus_y = sum(c * (x - y) ** k for k, c in enumerate(coefficients))
+    sums = f_y.resultant(f_x_minus_y, y).univariate_polynomial(S)
+
+    # The pairs i = j contribute prod (x - 2 a_i) = 2^n f(x/2)
+    doubled = S([c * 2 ** (n - k) for k, c in enumerate(coefficients)])
+    square, remainder = sums.quo_rem(doubled)
+    if remainder != 0:
+        return None
+
+    degrees = []
+    for factor, exponent in square.factor():
+        if exponent != 2:
+            return None
+        degrees.append(int(factor.degree()))
+    return tuple(sorted(degrees))
+
+
+def two_set_orbits(poly, attempts: int = 4) -> Optional[Tuple[int, ...]]:
+    """
+    Orbit lengths of the Galois group of an irreducible polynomial on pairs of roots, sorted,
+    or None if no squarefree resolvent was found in `attempts` transformations.
+    """
+    for c in range(attempts):
+        g = tschirnhaus(poly, c)
+        if not g.is_squarefree():
+            continue
+        degrees = two_set_factor_degrees(g)
+        if degrees is not None:
+            return degrees
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def two_set_orbit_lengths(n: int, t_number: int) -> Tuple[int, ...]:
+    """Sorted orbit lengths of the transitive group nTt on 2-subsets, from the group metadata table."""
+    return tuple(group_metadata(n, t_number)["two_set_orbits"])
@@ -0,0 +1,113 @@
+"""
+Result cache for Galois group and splitting field computations.
+Entries are keyed by (kind, canonical polynomial) and live in a bounded
+in-memory LRU tier, optionally backed by an SQLite file that survives restarts.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+# Per-request fields that describe one computation rather than the polynomial
+TRANSIENT_FIELDS = ("computation_time_seconds", "queue_wait_seconds", "job_id", "cache_hit", "field_cache_hit", "timings")
+
+
+class ResultCache:
+    """Two-tier (memory LRU + optional SQLite) cache of computation results."""
+
+    def __init__(self, max_entries: int = 1024, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " kind TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " PRIMARY KEY (kind, key))"
+            )
+            self._db.commit()
+
+    @classmethod
+    def from_env(cls) -> "ResultCache":
+        """Build the cache from GALOIS_CACHE_SIZE and GALOIS_CACHE_PATH."""
+        return cls(
+            max_entries=int(os.environ.get('GALOIS_CACHE_SIZE', 1024)),
+            path=os.environ.get('GALOIS_CACHE_PATH') or None,
+        )
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._memory.get((kind, key))
+            if value is not None:
+                self._memory.move_to_end((kind, key))
+                self.hits += 1
+                return dict(value)
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM results WHERE kind = ? AND key = ?", (kind, key)
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(kind, key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return dict(value)
+
+            self.misses += 1
+            return None
+
+    def put(self, kind: str, key: str, value: Dict[str, Any]):
+        value = {k: v for k, v in value.items() if k not in TRANSIENT_FIELDS}
+        with self._lock:
+            self._remember(kind, key, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (kind, key, value, created_at) VALUES (?, ?, ?, ?)",
+                    (kind, key, json.dumps(value), time.time()),
+                )
+                self._db.commit()
+
+    def _remember(self, kind: str, key: str, value: Dict[str, Any]):
+        self._memory[(kind, key)] = value
+        self._memory.move_to_end((kind, key))
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            disk_entries = None
+            if self._db is not None:
+                disk_entries = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.max_entries,
+                "disk_entries": disk_entries,
+                "path": self.path,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,169 @@
+"""
+Root computation and display.
+All roots are isolated in one batch with certified interval arithmetic, then
+grouped into the display forms "±r" (a real root and its negative) and
+"a ± bi" (a complex conjugate pair). Pairing is done by sorting the interval
+centres, not by pairwise scans with fixed tolerances. Structural facts are
+decided exactly: which roots have a negative partner, how many roots are real,
+and how many are purely imaginary. The working precision is only raised when
+the intervals are too wide to agree with those facts, or too wide for the
+requested number of digits.
+"""
+
+import math
+from decimal import Decimal, localcontext
+from typing import List
+
+import numpy as np
+
+
+DEFAULT_DIGITS = 6
+MAX_DIGITS = 100
+MAX_PRECISION_BITS = 16384
+
+
+class _NeedPrecision(Exception):
+    """The isolating intervals are too wide; retry at a higher precision."""
+
+
+def split_negation_closed(poly):
+    """
+    Split a squarefree polynomial into (g, h) with poly = g * h, where the roots of g are
+    closed under r -> -r and no root of h has its negative among the roots of poly.
+    """
+    x = poly.parent().gen()
+    g = poly.gcd(poly(-x))
+    return g, poly // g
+
+
+def count_imaginary_roots(poly) -> int:
+    """Exact number of nonzero purely imaginary roots: f(iy) = E(y) + i O(y) with E, O sharing a real root."""
+    R = poly.parent()
+    coefficients = poly.list()
+    even = R([c * (-1) ** (k // 2) if k % 2 == 0 else 0 for k, c in enumerate(coefficients)])
+    odd = R([c * (-1) ** (k // 2) if k % 2 == 1 else 0 for k, c in enumerate(coefficients)])
+    common = even.gcd(odd)
+    if common.degree() < 1:
+        return 0
+    y = R.gen()
+    while common(0) == 0:
+        common = common // y
+    return int(common.number_of_real_roots()) if common.degree() >= 1 else 0
+
+
+class RootIsolation:
+    """Certified isolating intervals of a polynomial's roots, with array views of their centres."""
+
+    def __init__(self, poly, prec: int):
+        from sage.rings.polynomial.complex_roots import complex_roots  # type: ignore
+
+        self.prec = prec
+        self.intervals = [z for z, _ in complex_roots(poly, min_prec=prec)] if poly.degree() >= 1 else []
+        self.re = np.array([float(z.real().center()) for z in self.intervals])
+        self.im = np.array([float(z.imag().center()) for z in self.intervals])
+        self.radius = np.array([
+            max(float(z.real().absolute_diameter()), float(z.imag().absolute_diameter())) / 2
+            for z in self.intervals
+        ])
+        self.im_has_zero = np.array([bool(z.imag().contains_zero()) for z in self.intervals], dtype=bool)
+        self.re_has_zero = np.array([bool(z.real().contains_zero()) for z in self.intervals], dtype=bool)
+
+    def check(self, digits: int, real_count: int):
+        """Intervals must be narrow enough to print and must single out exactly the real roots."""
+        if len(self.intervals) and self.radius.max() >= 0.5 * 10.0 ** -(digits + 1):
+            raise _NeedPrecision()
+        if int(self.im_has_zero.sum()) != real_count:
+            raise _NeedPrecision()
+
+
+def format_decimal(interval, digits: int) -> str:
+    """Format the centre of a real interval to `digits` decimals from its exact binary value."""
+    q = interval.center().exact_rational()
+    with localcontext() as context:
+        context.prec = digits + 20 + len(str(abs(int(q.numerator()))))
+        d = Decimal(int(q.numerator())) / Decimal(int(q.denominator()))
+        return f"{d:.{digits}f}"
+
+
+def _pair_real_with_negatives(isolation: RootIsolation, digits: int) -> List[str]:
+    """Every real root here has its negative among the roots: pair smallest with largest."""
+    real = np.flatnonzero(isolation.im_has_zero)
+    order = real[np.argsort(isolation.re[real])]
+    roots = []
+    for k in range((len(order) + 1) // 2):
+        low, high = order[k], order[len(order) - 1 - k]
+        value = isolation.intervals[high].real()
+        if low == high:
+            # The root 0 is its own negative
+            roots.append(format_decimal(value, digits))
+        else:
+            if not (isolation.intervals[low].real() + value).contains_zero():
+                raise _NeedPrecision()
+            roots.append(f"\\pm {format_decimal(value.abs(), digits)}")
+    return roots
+
+
+def _lone_real_roots(isolation: RootIsolation, digits: int) -> List[str]:
+    real = np.flatnonzero(isolation.im_has_zero)
+    order = real[np.argsort(isolation.re[real])]
+    return [format_decimal(isolation.intervals[i].real(), digits) for i in order]
+
+
+def _pair_conjugates(isolation: RootIsolation, digits: int, imaginary_count: int) -> List[str]:
+    """Non-real roots of a real polynomial come in conjugate pairs; match them by sorting."""
+    nonreal = np.flatnonzero(~isolation.im_has_zero)
+    upper = nonreal[isolation.im[nonreal] > 0]
+    lower = nonreal[isolation.im[nonreal] < 0]
+    if len(upper) != len(lower):
+        raise _NeedPrecision()
+
+    upper = upper[np.lexsort((isolation.im[upper], isolation.re[upper]))]
+    lower = lower[np.lexsort((-isolation.im[lower], isolation.re[lower]))]
+
+    if int(isolation.re_has_zero[upper].sum()) != imaginary_count // 2:
+        raise _NeedPrecision()
+
+    roots = []
+    for i, j in zip(upper, lower):
+        z, w = isolation.intervals[i], isolation.intervals[j]
+        if not z.conjugate().overlaps(w):
+            raise _NeedPrecision()
+        imag_part = format_decimal(z.imag().abs(), digits)
+        if isolation.re_has_zero[i]:
+            roots.append(f"\\pm {imag_part}i")
+        else:
+            roots.append(f"{format_decimal(z.real(), digits)} \\pm {imag_part}i")
+    return roots
+
+
+def format_roots(poly, digits: int = DEFAULT_DIGITS) -> List[str]:
+    """
+    Display strings for all roots of a squarefree polynomial over Q, e.g. "\\pm 1.414214"
+    or "0.500000 \\pm 0.866025i", printed with `digits` decimals.
+    """
+    digits = max(0, min(int(digits), MAX_DIGITS))
+    paired, unpaired = split_negation_closed(poly)
+
+    counts = []
+    for part in (paired, unpaired):
+        real_count = int(part.number_of_real_roots()) if part.degree() >= 1 else 0
+        counts.append((real_count, count_imaginary_roots(part) if part.degree() >= 1 else 0))
+
+    # Enough bits for the requested digits, doubled whenever the intervals are too coarse
+    prec = max(53, int(math.ceil((digits + 2) * math.log2(10))) + 10)
+    while True:
+        try:
+            roots = []
+            for part, (real_count, imaginary_count) in zip((paired, unpaired), counts):
+                isolation = RootIsolation(part, prec)
+                isolation.check(digits, real_count)
+                if part is paired:
+                    roots += _pair_real_with_negatives(isolation, digits)
+                else:
+                    roots += _lone_real_roots(isolation, digits)
+                roots += _pair_conjugates(isolation, digits, imaginary_count)
+            return roots
+        except _NeedPrecision:
+            if prec >= MAX_PRECISION_BITS:
+                raise ValueError("Could not separate the roots at the maximum working precision")
+            prec *= 2
@@ -0,0 +1,60 @@
+"""
+SageMath import for the backend.
+The API process never imports Sage: parsing, canonical keys, caching and the field
+index are pure Python. Worker processes import it once at startup through
+import_sage(), which times and logs the import. With GALOIS_SAGE_IMPORT=minimal
+only the Sage components the backend uses are imported instead of all of
+sage.all, which shortens worker start-up.
+"""
+
+import importlib
+import logging
+import os
+import time
+from typing import Optional
+
+
+SAGE_IMPORT_MODE = os.environ.get('GALOIS_SAGE_IMPORT', 'full')
+
+# Everything the backend, pre-screen, root engine and group metadata use
+SAGE_COMPONENTS = (
+    "sage.rings.integer_ring",
+    "sage.rings.rational_field",
+    "sage.rings.polynomial.polynomial_ring_constructor",
+    "sage.rings.polynomial.complex_roots",
+    "sage.rings.finite_rings.finite_field_constructor",
+    "sage.rings.number_field.number_field",
+    "sage.groups.perm_gps.permgroup_named",
+    "sage.arith.misc",
+    "sage.libs.pari",
+    "sage.libs.gap.libgap",
+)
+
+logger = logging.getLogger("galois")
+
+_import_seconds: Optional[float] = None
+
+
+def import_sage() -> float:
+    """Import SageMath once per process and return how many seconds the import took."""
+    global _import_seconds
+    if _import_seconds is None:
+        start = time.perf_counter()
+        mode = SAGE_IMPORT_MODE
+        if mode == "minimal":
+            try:
+                for name in SAGE_COMPONENTS:
+                    importlib.import_module(name)
+            except ImportError as e:
+                logger.warning("Minimal SageMath import failed (%s), importing sage.all instead", e)
+                mode = "full"
+        if mode != "minimal":
+            importlib.import_module("sage.all")
+        _import_seconds = round(time.perf_counter() - start, 3)
+        logger.info("Imported SageMath (%s) in %.2fs in process %d", mode, _import_seconds, os.getpid())
+    return _import_seconds
+
+
+def sage_import_seconds() -> Optional[float]:
+    """Seconds the Sage import took in this process, or None if Sage has not been imported."""
+    return _import_seconds
@@ -1,7 +1,7 @@
 #!/bin/bash
 
 echo "Starting Galois Playground Backend..."
-echo "Ultra-fast backend with direct SageMath import"
+echo "FastAPI backend with pre-warmed SageMath workers"
 echo ""
 
 # Detect conda or mamba automatically
@@ -53,8 +53,8 @@ python -c "import fastapi, uvicorn" 2>/dev/null || {
     pip install fastapi uvicorn
 }
 
-# Check if SageMath is available
-python -c "import sage.all" 2>/dev/null || {
+# Check that SageMath is installed without importing it (workers import it once at startup)
+python -c "import importlib.util, sys; sys.exit(importlib.util.find_spec('sage') is None)" 2>/dev/null || {
     echo "Error: SageMath not found in the current Python environment."
     echo "Please ensure SageMath is installed correctly."
     echo "You can install it with: conda install -c conda-forge sagemath"
@@ -62,6 +62,7 @@ python -c "import sage.all" 2>/dev/null || {
 }
 
 echo "Environment ready. Starting backend server..."
+echo "Workers warm up in the background; GET /ready returns 200 once they can take traffic."
 echo ""
 
 # Start the backend
@@ -0,0 +1,75 @@
+"""Tests for the Sage-free input parser: size limits and canonical forms."""
+
+from fractions import Fraction
+
+import pytest
+
+import polynomial_parser
+from polynomial_parser import (PolynomialParseError, PolynomialTooLarge, canonical_form, format_polynomial,
+                               monic, parse_coefficients)
+
+
+def test_parses_products_powers_and_rationals():
+    assert parse_coefficients("(x+1)(x-1)/2") == [Fraction(-1, 2), 0, Fraction(1, 2)]
+    assert parse_coefficients("1.5x^2 + 1") == [1, 0, Fraction(3, 2)]
+    assert parse_coefficients("2**-1 * x") == [0, Fraction(1, 2)]
+    assert parse_coefficients("x - x") == []
+
+
+@pytest.mark.parametrize("text", ["", "x^", "x^x", "x^(1/2)", "1/x", "(x+1", "x $ 1", "2^-1^x"])
+def test_rejects_malformed_input(text):
+    with pytest.raises(PolynomialParseError) as error:
+        parse_coefficients(text)
+    assert not isinstance(error.value, PolynomialTooLarge)
+
+
+def test_degree_limit():
+    limit = polynomial_parser.MAX_DEGREE
+    assert len(parse_coefficients(f"x^{limit} + 1")) == limit + 1
+    for text in (f"x^{limit + 1}", f"x^{limit} * x", f"(x+1)^{limit + 1}", "(x+1)^100000"):
+        with pytest.raises(PolynomialTooLarge):
+            parse_coefficients(text)
+
+
+def test_degree_limit_counts_cancellation_after_the_fact():
+    limit = polynomial_parser.MAX_DEGREE
+    # The intermediate product is over the limit even though the result would not be
+    with pytest.raises(PolynomialTooLarge):
+        parse_coefficients(f"x^{limit} * x - x^{limit + 1}")
+
+
+def test_coefficient_limit():
+    bits = polynomial_parser.MAX_COEFFICIENT_BITS
+    parse_coefficients(f"2^{bits - 1} * x")
+    for text in (f"2^{bits + 1} * x", f"x + 1/2^{bits + 1}", "x + 10^100000", str(2 ** (bits + 1))):
+        with pytest.raises(PolynomialTooLarge):
+            parse_coefficients(text)
+
+
+def test_input_length_limit(monkeypatch):
+    monkeypatch.setattr(polynomial_parser, "MAX_INPUT_LENGTH", 20)
+    parse_coefficients("x^2 + 2*x + 1")
+    with pytest.raises(PolynomialTooLarge):
+        parse_coefficients("x^2 + " + " + ".join(["1"] * 10))
+
+
+def test_format_matches_sage_printing():
+    assert format_polynomial([3, Fraction(-1, 2), 0, 1]) == "x^3 - 1/2*x + 3"
+    assert format_polynomial([-1, 0, -2]) == "-2*x^2 - 1"
+    assert format_polynomial([]) == "0"
+
+
+def test_monic_leaves_constants_alone():
+    assert monic([2, 4]) == [Fraction(1, 2), 1]
+    assert monic([Fraction(5)]) == [5]
+    assert monic([]) == []
+
+
+@pytest.mark.parametrize("spelling", ["2*x^2 - 4", "x^2-2", "(x^2 - 2)/3", "-x^2 + 2", "x*x - 2", "0.5x^2 - 1"])
+def test_equivalent_spellings_share_a_canonical_key(spelling):
+    assert canonical_form(spelling)[1] == "x^2 - 2"
+
+
+def test_canonical_form_keeps_the_printed_input():
+    assert canonical_form("2*x^2 - 4") == ("2*x^2 - 4", "x^2 - 2")
+    assert canonical_form(" (x+1)^2 ") == ("x^2 + 2*x + 1", "x^2 + 2*x + 1")
@@ -288,55 +288,28 @@ export default function GaloisPlayground() {
   const [splittingFieldLoading, setSplittingFieldLoading] = useState(false);
   const [result, setResult] = useState(null);
   const [error, setError] = useState(null);
-  const [isPollingForSplittingField, setIsPollingForSplittingField] = useState(false);
+  const eventSourceRef = useRef(null);
 
-  // Effect for polling splitting field data
-  useEffect(() => {
-    if (!result || !result.splitting_field || !result.splitting_field.computing) {
-      return;
-    }
+  // Close any open computation stream when the component unmounts
+  useEffect(() => () => eventSourceRef.current?.close(), []);
 
-    setIsPollingForSplittingField(true);
-    const pollInterval = setInterval(async () => {
-      try {
-        const response = await fetch("/api/splitting-field", {
-          method: "POST",
-          headers: {
-            "Content-Type": "application/json",
-          },
-          body: JSON.stringify({ 
-            polynomial: result.polynomial.replace(/\\cdot/g, '*')
-          }),
-        });
-        
-        if (!response.ok) {
-          console.error("Error polling for splitting field data");
-          return;
-        }
-        
-        const data = await response.json();
-        
-        if (data.computation_successful && data.splitting_field) {
-          clearInterval(pollInterval);
-          setIsPollingForSplittingField(false);
-          setResult(prevResult => ({
-            ...prevResult,
-            splitting_field: {
-              ...data.splitting_field,
-              computing: false,
-              computed: true
-            }
-          }));
-        }
-      } catch (error) {
-        console.error("Error polling for splitting field:", error);
-      }
-    }, 2000); // Poll every 2 seconds
-    
-    return () => clearInterval(pollInterval);
-  }, [result]);
+  const showComputationError = (data) => {
+    if (data.error_type === "reducible_polynomial") {
+      setError({
+        type: "reducible",
+        message: data.error,
+        polynomial: data.polynomial,
+        degree: data.degree
+      });
+    } else {
+      setError({
+        type: "computation",
+        message: data.error || "Computation failed for unknown reason"
+      });
+    }
+  };
 
-  const handleSubmit = async () => {
+  const handleSubmit = () => {
     if (!polynomial.trim()) {
       setError("Please enter a polynomial");
       return;
@@ -358,55 +331,87 @@ export default function GaloisPlayground() {
     setLoading(true);
     setResult(null);
     setError(null);
+    eventSourceRef.current?.close();
+
+    // One stream per computation: the backend pushes each stage as soon as it is done
+    const params = new URLSearchParams({
+      polynomial: processedPolynomial,
+      compute_splitting_field: computeSplittingField
+    });
+    const source = new EventSource(`/api/galois/stream?${params}`);
+    eventSourceRef.current = source;
+    let parsed = null;
+    let gotResult = false;
+    let awaitingSplittingField = false;
+
+    const listen = (event, handler) => {
+      source.addEventListener(event, (e) => handler(JSON.parse(e.data)));
+    };
 
-    try {
-      const response = await fetch("/api/galois", {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({ 
-          polynomial: processedPolynomial,
-          compute_splitting_field: computeSplittingField
-        }),
-      });
+    listen("parsed", (data) => {
+      parsed = data;
+    });
 
-      if (!response.ok) {
-        const errorData = await response.json().catch(() => ({}));
-        throw new Error(errorData.detail || `HTTP error! status: ${response.status}`);
-      }
+    listen("group", (data) => {
+      setResult({ polynomial: parsed.polynomial, degree: data.degree, galois_group: data.galois_group });
+    });
 
-      const data = await response.json();
-      console.log("Backend response:", data);
-      
-      if (!data.computation_successful) {
-        // Check for specific error types
-        if (data.error_type === "reducible_polynomial") {
-          setError({
-            type: "reducible",
-            message: data.error,
-            polynomial: data.polynomial,
-            degree: data.degree
-          });
-        } else {
-          setError({
-            type: "computation",
-            message: data.error || "Computation failed for unknown reason"
-          });
-        }
-        return;
-      }
+    listen("roots", (data) => {
+      setResult(prevResult => ({ ...prevResult, roots: data.roots }));
+    });
 
-      setResult(data);
-    } catch (error) {
-      console.error("Error calling backend:", error);
-      setError({
-        type: "network",
-        message: `Network error: ${error.message}`
+    listen("result", (data) => {
+      console.log("Backend response:", data);
+      gotResult = true;
+      awaitingSplittingField = computeSplittingField;
+      setLoading(false);
+      setResult({
+        ...data,
+        splitting_field: computeSplittingField ? { computing: true, computed: false } : null
       });
-    } finally {
+    });
+
+    listen("splitting_field", (data) => {
+      awaitingSplittingField = false;
+      setResult(prevResult => ({
+        ...prevResult,
+        splitting_field: data.computation_successful && data.splitting_field
+          ? { ...data.splitting_field, computing: false, computed: true }
+          : {
+              computing: false,
+              computed: false,
+              error: data.error || "Splitting field computation failed"
+            }
+      }));
+    });
+
+    // Computation failures arrive as "failed"; "error" is reserved for EventSource transport errors
+    listen("failed", (data) => {
+      source.close();
       setLoading(false);
-    }
+      setResult(null);
+      showComputationError(data);
+    });
+
+    listen("done", () => source.close());
+
+    source.onerror = () => {
+      // The stream dropped before it finished; do not let EventSource reconnect and start over
+      source.close();
+      setLoading(false);
+      if (!gotResult) {
+        setResult(null);
+        setError({
+          type: "network",
+          message: "Network error: lost connection to the backend"
+        });
+      } else if (awaitingSplittingField) {
+        setResult(prevResult => ({
+          ...prevResult,
+          splitting_field: { computing: false, computed: false, error: "Connection to the backend was lost" }
+        }));
+      }
+    };
   };
   
   // Function to load splitting field data separately
@@ -416,15 +421,9 @@ export default function GaloisPlayground() {
     setSplittingFieldLoading(true);
     
     try {
-      const response = await fetch("/api/splitting-field", {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({ 
-          polynomial: result.polynomial.replace(/\\cdot/g, '*')
-        }),
-      });
+      // Cacheable GET: repeat views are answered by the browser or the proxy cache
+      const params = new URLSearchParams({ polynomial: result.polynomial.replace(/\\cdot/g, '*') });
+      const response = await fetch(`/api/splitting-field?${params}`);
       
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
@@ -564,7 +563,7 @@ export default function GaloisPlayground() {
                     <p>• Simple forms: <MathDisplay inline>{"x^n \\pm c"}</MathDisplay> (e.g., <MathDisplay inline>{"x^3-2, x^4+5"}</MathDisplay>)</p>
                     <p>• With coefficients: <MathDisplay inline>{"ax^n + bx^{n-1} + \\ldots"}</MathDisplay> (e.g., <MathDisplay inline>{"3x^3+2x^2-x+1"}</MathDisplay>)</p>
                     <p>• Quadratic-like: <MathDisplay inline>{"x^4 + ax^2 + b"}</MathDisplay> (e.g., <MathDisplay inline>{"x^4-10x^2+1"}</MathDisplay>)</p>
-                    <p className="text-purple-300 font-medium">⚠️ Polynomial must be irreducible over ℚ for Galois group computation</p>
+                    <p>• Reducible: <MathDisplay inline>{"(x^2-2)(x^2-3)"}</MathDisplay> is handled factor by factor, with each irreducible factor of degree at most 15</p>
                   </div>
                 </div>
               </div>
@@ -699,6 +698,21 @@ export default function GaloisPlayground() {
                         {result.galois_group?.description || 'N/A'}
                       </div>
                     </div>
+                    {result.factors && (
+                      <div className="bg-gradient-to-r from-gray-700 to-gray-800 rounded-lg p-4 border border-gray-600">
+                        <h3 className="font-semibold text-gray-200 mb-2">Irreducible Factors</h3>
+                        <div className="space-y-2">
+                          {result.factors.map((factor, index) => (
+                            <div key={index} className="flex items-center justify-between p-2 bg-gray-900 rounded border border-gray-700 text-sm text-gray-300">
+                              <MathDisplay inline>
+                                {`(${factor.polynomial.replace(/\^(\d+)/g, '^{$1}').replace(/\*/g, '')})${factor.multiplicity > 1 ? `^{${factor.multiplicity}}` : ''}`}
+                              </MathDisplay>
+                              <span>{factor.galois_group?.transitive_label} (order {factor.galois_group?.order})</span>
+                            </div>
+                          ))}
+                        </div>
+                      </div>
+                    )}
                   </div>
                   
                   {/* Right column */}
@@ -706,7 +720,7 @@ export default function GaloisPlayground() {
                     <div className="bg-gradient-to-r from-gray-800 to-gray-700 rounded-lg p-4 border border-gray-600">
                       <h3 className="font-semibold text-gray-200 mb-2">Splitting Field</h3>
                       <div className="text-sm text-gray-300 text-center p-2 bg-gray-900 rounded border border-gray-700 break-words">
-                        {(splittingFieldLoading || (result.splitting_field && result.splitting_field.computing) || isPollingForSplittingField) ? (
+                        {(splittingFieldLoading || (result.splitting_field && result.splitting_field.computing)) ? (
                           <div className="flex flex-col items-center justify-center py-6">
                             <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-purple-500 mb-2"></div>
                             <p className="text-gray-300">Computing splitting field...</p>
@@ -0,0 +1,363 @@
+"""
+Managed pool of pre-warmed SageMath worker processes.
+Each worker is a single-process executor with sage.all already imported, so
+requests never pay the import cost and the asyncio event loop never blocks on
+a Sage computation.
+
+Tasks can carry a Budget. Inside the worker the time budget is enforced with a
+Sage alarm, which cancels the computation cleanly and returns partial results.
+A watchdog thread in the parent is the backstop: it kills a worker that
+overruns its time budget by more than the grace period, or that exceeds its
+memory budget. It then replaces the worker with a fresh one. A worker whose
+process dies on its own (a segfault, the kernel's OOM killer) is replaced when
+the pool notices, and its tasks are run once more on the replacement.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from budgets import (Budget, HARD_KILL_GRACE_SECONDS, MEMORY_BUDGETS_MB, budget_exceeded_result,
+                     is_memory_error, partial_results, reset_partial)
+from sage_runtime import import_sage
+
+
+DEFAULT_POOL_SIZE = os.cpu_count() or 1
+WATCHDOG_INTERVAL_SECONDS = 0.5
+
+# An affine worker counts as busy once its current task has run this long, or once its queue is this
+# many tasks longer than the least loaded worker's; affine tasks then go to the least loaded worker
+AFFINITY_BUSY_SECONDS = float(os.environ.get('GALOIS_AFFINITY_BUSY_SECONDS', 2.0))
+AFFINITY_QUEUE_SLACK = int(os.environ.get('GALOIS_AFFINITY_QUEUE_SLACK', 4))
+
+logger = logging.getLogger("galois")
+
+
+class BudgetExceeded(Exception):
+    """Raised for a task whose worker had to be killed for overrunning its budget."""
+
+    def __init__(self, error_type: str, budget: Optional[Budget]):
+        super().__init__(error_type)
+        self.error_type = error_type
+        self.budget = budget
+
+
+def _init_worker():
+    """Import SageMath once per worker process, before any task arrives."""
+    os.environ['SAGE_NUM_THREADS'] = '1'
+    os.environ['OMP_NUM_THREADS'] = '1'
+    os.environ.setdefault('PARI_SIZE', '2000000000')
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    import_sage()
+    from sage.libs.pari import pari  # type: ignore
+    from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing  # type: ignore
+    from sage.rings.rational_field import QQ  # type: ignore
+
+    # Let PARI fail with a memory error before the watchdog has to kill the process
+    sizemax = int(max(MEMORY_BUDGETS_MB.values()) * 2**20)
+    pari.allocatemem(min(int(os.environ['PARI_SIZE']), sizemax), sizemax, silent=True)
+
+    # Touch the polynomial machinery so the first real request runs warm
+    PolynomialRing(QQ, 'x').gen().is_irreducible()
+
+
+def _run_task(fn: Callable[..., Any], args: tuple, submitted_at: float, budget: Optional[Budget]):
+    from cysignals.alarm import AlarmInterrupt, alarm, cancel_alarm  # type: ignore
+
+    started_at = time.time()
+    recycle = False
+    reset_partial()
+    try:
+        if budget is not None and budget.seconds:
+            alarm(budget.seconds)
+        result = fn(*args)
+    except AlarmInterrupt:
+        result = budget_exceeded_result("timeout", budget, args[0] if args else None, partial_results())
+    except MemoryError:
+        result = budget_exceeded_result("memory_exceeded", budget, args[0] if args else None, partial_results())
+    finally:
+        cancel_alarm()
+
+    if isinstance(result, dict) and not result.get("computation_successful") and is_memory_error(result.get("error")):
+        result = budget_exceeded_result("memory_exceeded", budget, result.get("polynomial"), partial_results())
+    if isinstance(result, dict) and result.get("error_type") in ("timeout", "memory_exceeded"):
+        # Interrupted Sage/PARI/GAP state is not worth trusting; start this worker afresh
+        recycle = True
+    return result, started_at, time.time(), recycle
+
+
+class PoolFuture(Future):
+    """Future for a pooled task, annotated with its queue wait and run time."""
+
+    def __init__(self, fn: Callable[..., Any], args: tuple, budget: Optional[Budget]):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.budget = budget
+        self.worker_index: Optional[int] = None
+        self.submitted_at = time.time()
+        self.queue_wait_seconds: Optional[float] = None
+        self.run_seconds: Optional[float] = None
+        self.retried = False
+
+
+class _Worker:
+    """One single-process executor plus the queue of pool tasks sent to it."""
+
+    def __init__(self, context):
+        self.executor = ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_init_worker)
+        self.queue: Deque[PoolFuture] = deque()
+        self.head_started_at: Optional[float] = None
+        self.killed: Optional[BudgetExceeded] = None
+        self.killed_future: Optional[PoolFuture] = None
+        self.abandoned: Set[PoolFuture] = set()
+        self.created_at = time.time()
+        self.warm = False
+        self.warm_up: Optional[Dict[str, Any]] = None
+
+    def pids(self) -> List[int]:
+        # ProcessPoolExecutor does not expose its processes publicly
+        return list((getattr(self.executor, '_processes', None) or {}).keys())
+
+
+class WorkerPool:
+    """
+    Dispatch Sage computations to a fixed set of worker processes.
+    If `warm_up` is given as (fn, args), every new worker (including replacements of
+    recycled ones) runs it before any other task. The pool is `ready` once all of its
+    initial workers have finished warming up.
+    """
+
+    def __init__(self, size: Optional[int] = None, start_method: Optional[str] = None,
+                 warm_up: Optional[Tuple[Callable[..., Any], tuple]] = None):
+        self.size = max(1, size or int(os.environ.get('GALOIS_POOL_SIZE', DEFAULT_POOL_SIZE)))
+        # Forking a process that already holds PARI and the event loop is unsafe, so spawn by default
+        self._context = multiprocessing.get_context(start_method or os.environ.get('GALOIS_POOL_START_METHOD', 'spawn'))
+        self._lock = threading.RLock()
+        self._warm_up = warm_up
+        self._ready = threading.Event()
+        self.started_at = time.time()
+        self._workers: List[_Worker] = [_Worker(self._context) for _ in range(self.size)]
+        self.recycled = 0
+        self.affinity_fallbacks = 0
+        self._closed = threading.Event()
+        with self._lock:
+            for index in range(self.size):
+                self._start_warm_up(index)
+        self._watchdog = threading.Thread(target=self._watch, name="galois-pool-watchdog", daemon=True)
+        self._watchdog.start()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def _start_warm_up(self, index: int):
+        """Queue the warm-up task first on worker `index`. Must be called with the lock held."""
+        worker = self._workers[index]
+        if self._warm_up is None:
+            worker.warm = True
+            self._check_ready()
+            return
+        fn, args = self._warm_up
+        future = PoolFuture(fn, args, None)
+        self._dispatch(future, index)
+        future.add_done_callback(lambda f: self._warmed(worker, f))
+
+    def _warmed(self, worker: _Worker, future: PoolFuture):
+        error = future.exception()
+        with self._lock:
+            worker.warm = True
+            worker.warm_up = {"error": str(error)} if error is not None else future.result()
+            if error is not None:
+                logger.warning("Worker warm-up failed: %s", error)
+            else:
+                logger.info("Worker warm after %.2fs: %s", time.time() - worker.created_at, worker.warm_up)
+            self._check_ready()
+
+    def _check_ready(self):
+        if not self._ready.is_set() and all(worker.warm for worker in self._workers):
+            self._ready.set()
+            logger.info("All %d workers warm after %.2fs", self.size, time.time() - self.started_at)
+
+    def _pick_worker(self, affinity: Optional[str]) -> int:
+        least_loaded = min(range(self.size), key=lambda i: len(self._workers[i].queue))
+        if affinity is None:
+            return least_loaded
+        index = zlib.crc32(affinity.encode()) % self.size
+        worker = self._workers[index]
+        # Reusing the worker's context is worth a short wait, not a place behind a long-running job
+        long_running = worker.head_started_at is not None and time.time() - worker.head_started_at > AFFINITY_BUSY_SECONDS
+        backlog = len(worker.queue) - len(self._workers[least_loaded].queue)
+        if backlog > 0 and (long_running or backlog >= AFFINITY_QUEUE_SLACK):
+            self.affinity_fallbacks += 1
+            return least_loaded
+        return index
+
+    def submit(self, fn: Callable[..., Any], *args, affinity: Optional[str] = None,
+               budget: Optional[Budget] = None) -> PoolFuture:
+        """Queue `fn(*args)` on the least loaded worker, or on the worker owning `affinity` unless it is busy."""
+        future = PoolFuture(fn, args, budget)
+        with self._lock:
+            self._dispatch(future, self._pick_worker(affinity))
+        return future
+
+    def _dispatch(self, future: PoolFuture, index: int):
+        worker = self._workers[index]
+        future.worker_index = index
+        if not worker.queue:
+            worker.head_started_at = time.time()
+        worker.queue.append(future)
+        try:
+            inner = worker.executor.submit(_run_task, future.fn, future.args, future.submitted_at, future.budget)
+        except Exception as e:
+            worker.queue.remove(future)
+            worker.head_started_at = time.time() if worker.queue else None
+            if isinstance(e, BrokenProcessPool) and not future.retried and not self._closed.is_set():
+                # The process died while idle: replace it and run the task on the replacement
+                future.retried = True
+                self._replace(worker, kill=False)
+                self._dispatch(future, index)
+            else:
+                future.set_exception(e)
+            return
+        inner.add_done_callback(lambda inner_future: self._complete(worker, future, inner_future))
+
+    def _complete(self, worker: _Worker, future: PoolFuture, inner_future: Future):
+        with self._lock:
+            if future in worker.abandoned:
+                # Moved to the worker that replaced this one, which will complete it
+                return
+            if future in worker.queue:
+                worker.queue.remove(future)
+            worker.head_started_at = time.time() if worker.queue else None
+
+            try:
+                result, started_at, finished_at, recycle = inner_future.result()
+            except BrokenProcessPool as e:
+                if worker.killed is not None and future is worker.killed_future:
+                    future.set_exception(worker.killed)
+                elif not future.retried and not self._closed.is_set():
+                    future.retried = True
+                    if worker.killed is None and worker in self._workers:
+                        # The process died on its own (segfault, OOM kill): replace it, which moves
+                        # its other queued tasks along, and run this one on the replacement
+                        self._replace(worker, kill=False)
+                        self._dispatch(future, future.worker_index)
+                    else:
+                        # Collateral damage from recycling another task's worker: run it again elsewhere
+                        self._dispatch(future, self._pick_worker(None))
+                else:
+                    future.set_exception(e)
+                return
+            except BaseException as e:
+                future.set_exception(e)
+                return
+
+            if recycle:
+                self._replace(worker, kill=False)
+
+        future.queue_wait_seconds = round(max(0.0, started_at - future.submitted_at), 4)
+        future.run_seconds = round(finished_at - started_at, 4)
+        future.set_result(result)
+
+    def _replace(self, worker: _Worker, kill: bool):
+        """Swap in a fresh worker process. Must be called with the lock held."""
+        if worker not in self._workers:
+            return
+        index = self._workers.index(worker)
+        replacement = _Worker(self._context)
+        self._workers[index] = replacement
+        self.recycled += 1
+        self._start_warm_up(index)
+
+        if not kill:
+            # The old process is not trusted with anything else: its queued tasks move to the
+            # replacement, behind the warm-up, and its executor's copies are abandoned
+            worker.abandoned = set(worker.queue)
+            moved = list(worker.queue)
+            worker.queue.clear()
+            for future in moved:
+                self._dispatch(future, index)
+        for pid in worker.pids():
+            try:
+                os.kill(pid, 9)
+            except OSError:
+                pass
+        worker.executor.shutdown(wait=False, cancel_futures=False)
+
+    def _watch(self):
+        """Kill workers whose current task has overrun its time budget or its memory budget."""
+        page_size = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+        while not self._closed.wait(WATCHDOG_INTERVAL_SECONDS):
+            with self._lock:
+                for worker in list(self._workers):
+                    if not worker.queue or worker.head_started_at is None:
+                        continue
+                    head = worker.queue[0]
+                    budget = head.budget
+                    if budget is None:
+                        continue
+
+                    error_type = None
+                    if budget.seconds and time.time() - worker.head_started_at > budget.seconds + HARD_KILL_GRACE_SECONDS:
+                        error_type = "timeout"
+                    elif budget.memory_mb and _rss_bytes(worker.pids(), page_size) > budget.memory_mb * 2**20:
+                        error_type = "memory_exceeded"
+
+                    if error_type is not None:
+                        worker.killed = BudgetExceeded(error_type, budget)
+                        worker.killed_future = head
+                        self._replace(worker, kill=True)
+
+    async def run(self, fn: Callable[..., Any], *args, affinity: Optional[str] = None, budget: Optional[Budget] = None):
+        """Await a pooled computation, returning (result, queue_wait_seconds, run_seconds)."""
+        future = self.submit(fn, *args, affinity=affinity, budget=budget)
+        result = await asyncio.wrap_future(future)
+        return result, future.queue_wait_seconds, future.run_seconds
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.size,
+                "ready": self.ready,
+                "warm_workers": sum(worker.warm for worker in self._workers),
+                "pending_tasks": [len(worker.queue) for worker in self._workers],
+                "recycled_workers": self.recycled,
+                "affinity_fallbacks": self.affinity_fallbacks,
+                "warm_up": [worker.warm_up for worker in self._workers],
+            }
+
+    def shutdown(self):
+        self._closed.set()
+        with self._lock:
+            for worker in self._workers:
+                worker.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _rss_bytes(pids: List[int], page_size: int) -> int:
+    """Resident set size of the given processes (Linux /proc; 0 where unavailable)."""
+    total = 0
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/statm') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            pass
+    return total
+
+
+def budget_failure(error: BaseException, polynomial: str) -> Optional[dict]:
+    """The structured result for a task killed by the watchdog, or None for other errors."""
+    if isinstance(error, BudgetExceeded):
+        return budget_exceeded_result(error.error_type, error.budget, polynomial)
+    return None